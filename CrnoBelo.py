@@ -1,466 +1,81 @@
-import bisect
-
-
-"""
-Дефинирање на класа за структурата на проблемот кој ќе го решаваме со пребарување.
-Класата Problem е апстрактна класа од која правиме наследување за дефинирање на основните 
-карактеристики на секој проблем што сакаме да го решиме
-"""
-
-
-class Problem:
-    def __init__(self, initial, goal=None):
-        self.initial = initial
-        self.goal = goal
-
-    def successor(self, state):
-        """За дадена состојба, врати речник од парови {акција : состојба}
-        достапни од оваа состојба. Ако има многу следбеници, употребете
-        итератор кој би ги генерирал следбениците еден по еден, наместо да
-        ги генерирате сите одеднаш.
-
-        :param state: дадена состојба
-        :return:  речник од парови {акција : состојба} достапни од оваа
-                  состојба
-        :rtype: dict
-        """
-        raise NotImplementedError
-
-    def actions(self, state):
-        """За дадена состојба state, врати листа од сите акции што може да
-        се применат над таа состојба
-
-        :param state: дадена состојба
-        :return: листа на акции
-        :rtype: list
-        """
-        return self.successor(state).keys()
-
-    def result(self, state, action):
-        """За дадена состојба state и акција action, врати ја состојбата
-        што се добива со примена на акцијата над состојбата
-
-        :param state: дадена состојба
-        :param action: дадена акција
-        :return: резултантна состојба
-        """
-        possible = self.successor(state)
-        return possible[action]
-
-
-    def goal_test(self, state):
-        """Врати True ако state е целна состојба. Даденава имплементација
-        на методот директно ја споредува state со self.goal, како што е
-        специфицирана во конструкторот. Имплементирајте го овој метод ако
-        проверката со една целна состојба self.goal не е доволна.
-
-        :param state: дадена состојба
-        :return: дали дадената состојба е целна состојба
-        :rtype: bool
-        """
-        return state == self.goal
-
-    def path_cost(self, c, state1, action, state2):
-        """Врати ја цената на решавачкиот пат кој пристигнува во состојбата
-        state2 од состојбата state1 преку акцијата action, претпоставувајќи
-        дека цената на патот до состојбата state1 е c. Ако проблемот е таков
-        што патот не е важен, оваа функција ќе ја разгледува само состојбата
-        state2. Ако патот е важен, ќе ја разгледува цената c и можеби и
-        state1 и action. Даденава имплементација му доделува цена 1 на секој
-        чекор од патот.
-
-        :param c: цена на патот до состојбата state1
-        :param state1: дадена моментална состојба
-        :param action: акција која треба да се изврши
-        :param state2: состојба во која треба да се стигне
-        :return: цена на патот по извршување на акцијата
-        :rtype: float
-        """
-        return c + 1
-
-    def value(self):
-        """За проблеми на оптимизација, секоја состојба си има вредност. 
-        Hill-climbing и сличните алгоритми се обидуваат да ја максимизираат
-        оваа вредност.
-
-        :return: вредност на состојба
-        :rtype: float
-        """
-        raise NotImplementedError
-
-
-"""
-Дефинирање на класата за структурата на јазел од пребарување.
-Класата Node не се наследува
-"""
-
-
-class Node:
-    def __init__(self, state, parent=None, action=None, path_cost=0):
-        """Креирај јазол од пребарувачкото дрво, добиен од parent со примена
-        на акцијата action
-
-        :param state: моментална состојба (current state)
-        :param parent: родителска состојба (parent state)
-        :param action: акција (action)
-        :param path_cost: цена на патот (path cost)
-        """
-        self.state = state
-        self.parent = parent
-        self.action = action
-        self.path_cost = path_cost
-        self.depth = 0  # search depth
-        if parent:
-            self.depth = parent.depth + 1
-
-    def __repr__(self):
-        return "<Node %s>" % (self.state,)
-
-    def __lt__(self, node):
-        return self.state < node.state
-
-    def expand(self, problem):
-        """Излистај ги јазлите достапни во еден чекор од овој јазол.
-
-        :param problem: даден проблем
-        :return: листа на достапни јазли во еден чекор
-        :rtype: list(Node)
-        """
-        return [self.child_node(problem, action)
-                for action in problem.actions(self.state)]
-
-    def child_node(self, problem, action):
-        """Дете јазел
-
-        :param problem: даден проблем
-        :param action: дадена акција
-        :return: достапен јазел според дадената акција
-        :rtype: Node
-        """
-        next_state = problem.result(self.state, action)
-        return Node(next_state, self, action,
-                    problem.path_cost(self.path_cost, self.state,
-                                      action, next_state))
-
-    def solution(self):
-        """Врати ја секвенцата од акции за да се стигне од коренот до овој јазол.
-
-        :return: секвенцата од акции
-        :rtype: list
-        """
-        return [node.action for node in self.path()[1:]]
-
-    def solve(self):
-        """Врати ја секвенцата од состојби за да се стигне од коренот до овој јазол.
-
-        :return: листа од состојби
-        :rtype: list
-        """
-        return [node.state for node in self.path()[0:]]
-
-    def path(self):
-        """Врати ја листата од јазли што го формираат патот од коренот до овој јазол.
-
-        :return: листа од јазли од патот
-        :rtype: list(Node)
-        """
-        x, result = self, []
-        while x:
-            result.append(x)
-            x = x.parent
-        result.reverse()
-        return result
-
-    """Сакаме редицата од јазли кај breadth_first_search или 
-    astar_search да не содржи состојби - дупликати, па јазлите што
-    содржат иста состојба ги третираме како исти. [Проблем: ова може
-    да не биде пожелно во други ситуации.]"""
-
-    def __eq__(self, other):
-        return isinstance(other, Node) and self.state == other.state
-
-    def __hash__(self):
-        return hash(self.state)
-
-
-"""
-Дефинирање на помошни структури за чување на листата на генерирани, но непроверени јазли
-"""
-
-
-class Queue:
-    """Queue е апстрактна класа / интерфејс. Постојат 3 типа:
-        Stack(): Last In First Out Queue (стек).
-        FIFOQueue(): First In First Out Queue (редица).
-        PriorityQueue(order, f): Queue во сортиран редослед (подразбирливо,од најмалиот кон
-                                 најголемиот јазол).
-    """
-
-    def __init__(self):
-        raise NotImplementedError
-
-    def append(self, item):
-        """Додади го елементот item во редицата
-
-        :param item: даден елемент
-        :return: None
-        """
-        raise NotImplementedError
-
-    def extend(self, items):
-        """Додади ги елементите items во редицата
-
-        :param items: дадени елементи
-        :return: None
-        """
-        raise NotImplementedError
-
-    def pop(self):
-        """Врати го првиот елемент од редицата
-
-        :return: прв елемент
-        """
-        raise NotImplementedError
-
-    def __len__(self):
-        """Врати го бројот на елементи во редицата
-
-        :return: број на елементи во редицата
-        :rtype: int
-        """
-        raise NotImplementedError
-
-    def __contains__(self, item):
-        """Проверка дали редицата го содржи елементот item
-
-        :param item: даден елемент
-        :return: дали queue го содржи item
-        :rtype: bool
-        """
-        raise NotImplementedError
-
-
-class Stack(Queue):
-    """Last-In-First-Out Queue."""
-
-    def __init__(self):
-        self.data = []
-
-    def append(self, item):
-        self.data.append(item)
-
-    def extend(self, items):
-        self.data.extend(items)
-
-    def pop(self):
-        return self.data.pop()
-
-    def __len__(self):
-        return len(self.data)
-
-    def __contains__(self, item):
-        return item in self.data
-
-
-class FIFOQueue(Queue):
-    """First-In-First-Out Queue."""
-
-    def __init__(self):
-        self.data = []
-
-    def append(self, item):
-        self.data.append(item)
-
-    def extend(self, items):
-        self.data.extend(items)
-
-    def pop(self):
-        return self.data.pop(0)
+import sys
 
-    def __len__(self):
-        return len(self.data)
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-    def __contains__(self, item):
-        return item in self.data
+from searching_framework import (Problem, InstrumentedProblem, Node, breadth_first_graph_search,
+                                 bidirectional_breadth_first_search, uniform_cost_search,
+                                 astar_search, weighted_astar_search,
+                                 greedy_best_first_graph_search, ida_star_search,
+                                 external_breadth_first_search, parallel_breadth_first_search,
+                                 compare_searchers, benchmark_fifo)
 
 
-class PriorityQueue(Queue):
-    """Редица во која прво се враќа минималниот (или максималниот) елемент
-    (како што е определено со f и order). Оваа структура се користи кај
-    информирано пребарување"""
-    """"""
+class CrnoBelo(Problem):
 
-    def __init__(self, order=min, f=lambda x: x):
+    def __init__(self, n, initial, bitboard=False, symmetric=False):
         """
-        :param order: функција за подредување, ако order е min, се враќа елементот
-                      со минимална f(x); ако order е max, тогаш се враќа елементот
-                      со максимална f(x).
-        :param f: функција f(x)
+        :param n: големина на таблата (n x n)
+        :param initial: листа од n*n нули и единици, по редици
+        :param bitboard: ако е True, состојбата се чува како еден цел број
+                         од n*n битови (полето (i, j) е битот i*n+j), а секое
+                         притискање е еден XOR со однапред пресметана маска
+        :param symmetric: ако е True, state_key ја враќа канонската форма на
+                          состојбата (најмалата од нејзините 8 ротации и
+                          рефлексии), па пребарувањето ги чува само
+                          состојбите кои не се симетрични една на друга
         """
-        assert order in [min, 1000]
-        self.data = []
-        self.order = order
-        self.f = f
-
-    def append(self, item):
-        bisect.insort_right(self.data, (self.f(item), item))
-
-    def extend(self, items):
-        for item in items:
-            bisect.insort_right(self.data, (self.f(item), item))
-
-    def pop(self):
-        if self.order == min:
-            return self.data.pop(0)[1]
-        return self.data.pop()[1]
-
-    def __len__(self):
-        return len(self.data)
-
-    def __contains__(self, item):
-        return any(item == pair[1] for pair in self.data)
-
-    def __getitem__(self, key):
-        for _, item in self.data:
-            if item == key:
-                return item
-
-    def __delitem__(self, key):
-        for i, (value, item) in enumerate(self.data):
-            if item == key:
-                self.data.pop(i)
-
-
-import sys
-
-"""
-Неинформирано пребарување во рамки на дрво.
-Во рамки на дрвото не разрешуваме јамки.
-"""
-
-
-def tree_search(problem, fringe):
-    """ Пребарувај низ следбениците на даден проблем за да најдеш цел.
-
-    :param problem: даден проблем
-    :param fringe:  празна редица (queue)
-    :return: Node
-    """
-    fringe.append(Node(problem.initial))
-    while fringe:
-        node = fringe.pop()
-        # print(node.state)
-        if problem.goal_test(node.state):
-            return node
-        fringe.extend(node.expand(problem))
-    return None
-
-
-def breadth_first_tree_search(problem):
-    """Експандирај го прво најплиткиот јазол во пребарувачкото дрво.
-
-    :param problem: даден проблем
-    :return: Node
-    """
-    return tree_search(problem, FIFOQueue())
-
-
-def depth_first_tree_search(problem):
-    """Експандирај го прво најдлабокиот јазол во пребарувачкото дрво.
-
-    :param problem:даден проблем
-    :return: Node
-    """
-    return tree_search(problem, Stack())
-
-
-"""
-Неинформирано пребарување во рамки на граф
-Основната разлика е во тоа што овде не дозволуваме јамки, 
-т.е. повторување на состојби
-"""
-
-
-def graph_search(problem, fringe):
-    """Пребарувај низ следбениците на даден проблем за да најдеш цел.
-     Ако до дадена состојба стигнат два пата, употреби го најдобриот пат.
-
-    :param problem: даден проблем
-    :param fringe: празна редица (queue)
-    :return: Node
-    """
-    closed = set()
-    fringe.append(Node(problem.initial))
-    while fringe:
-        node = fringe.pop()
-        if problem.goal_test(node.state):
-            return node
-
-
-        if str(node.state) not in closed:
-            closed.add(str(node.state))
-            fringe.extend(node.expand(problem))
-
-
-    return None
+        self.n = n
+        self.bitboard = bitboard
+        self.symmetric = symmetric
+        self.akcii = ["x: " + str(i) + ", y: " + str(j)
+                      for i in range(0, n) for j in range(0, n)]
+        self.akcija_indeks = {akcija: k for k, akcija in enumerate(self.akcii)}
+
+        if symmetric:
+            # слика на полето (i, j) при секоја од 8-те симетрии на квадратот
+            m = n - 1
+            transforms = [lambda i, j: (i, j), lambda i, j: (j, m - i),
+                          lambda i, j: (m - i, m - j), lambda i, j: (m - j, i),
+                          lambda i, j: (i, m - j), lambda i, j: (m - i, j),
+                          lambda i, j: (j, i), lambda i, j: (m - j, m - i)]
+            self.permutations = [[t(i, j)[0] * n + t(i, j)[1] for i in range(0, n) for j in range(0, n)]
+                                 for t in transforms]
+            # за секоја симетрија освен идентитетот и за секоја редица,
+            # табела од битовите на редицата во нивната слика, за симетријата
+            # на bitboard да се пресмета со n пребарувања во табела
+            self.row_tables = []
+            for permutation in self.permutations[1:]:
+                tables = []
+                for i in range(0, n):
+                    table = [0] * (1 << n)
+                    for row in range(1, 1 << n):
+                        low = row & -row
+                        table[row] = table[row ^ low] | 1 << permutation[i * n + low.bit_length() - 1]
+                    tables.append(table)
+                self.row_tables.append(tables)
+
+        if bitboard:
+            dx = [0, 1, -1, 0, 0]
+            dy = [0, 0, 0, 1, -1]
+            self.masks = []
+            for i in range(0, n):
+                for j in range(0, n):
+                    mask = 0
+                    for z in range(0, 5):
+                        if 0 <= i + dx[z] < n and 0 <= j + dy[z] < n:
+                            mask |= 1 << ((i + dx[z]) * n + j + dy[z])
+                    self.masks.append(mask)
+
+            state = 0
+            for k in range(0, n * n):
+                if initial[k]:
+                    state |= 1 << k
+            super().__init__(state, (1 << n * n) - 1)
+            return
 
-
-def breadth_first_graph_search(problem):
-    """Експандирај го прво најплиткиот јазол во пребарувачкиот граф.
-
-    :param problem: даден проблем
-    :return: Node
-    """
-    return graph_search(problem, FIFOQueue())
-
-
-def depth_first_graph_search(problem):
-    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф.
-
-    :param problem: даден проблем
-    :return: Node
-    """
-    return graph_search(problem, Stack())
-
-
-def depth_limited_search(problem, limit=50):
-    def recursive_dls(node, problem, limit):
-        """Помошна функција за depth limited"""
-        cutoff_occurred = False
-        if problem.goal_test(node.state):
-            return node
-        elif node.depth == limit:
-            return 'cutoff'
-        else:
-            for successor in node.expand(problem):
-                result = recursive_dls(successor, problem, limit)
-                if result == 'cutoff':
-                    cutoff_occurred = True
-                elif result is not None:
-                    return result
-        if cutoff_occurred:
-            return 'cutoff'
-        return None
-
-    return recursive_dls(Node(problem.initial), problem, limit)
-
-
-def iterative_deepening_search(problem):
-    for depth in range(sys.maxsize):
-        result = depth_limited_search(problem, depth)
-        if result is not 'cutoff':
-            return result
-
-
-def uniform_cost_search(problem):
-    """Експандирај го прво јазолот со најниска цена во пребарувачкиот граф."""
-    return graph_search(problem, PriorityQueue(lambda a, b:
-                                               a.path_cost < b.path_cost))
-
-
-class CrnoBelo(Problem):
-
-    def __init__(self, n, initial):
         goal = []
         for i in range(0, n):
             row = []
@@ -507,6 +122,10 @@ class CrnoBelo(Problem):
                   состојба
         :rtype: dict
         """
+        if self.bitboard:
+            return {akcija: state ^ mask for akcija, mask in zip(self.akcii, self.masks)}
+
+        n = self.n
         succ = {}
 
         dx = [1, -1, 0, 0]
@@ -543,12 +162,96 @@ class CrnoBelo(Problem):
         return succ
 
     def actions(self, state):
+        if self.bitboard:
+            return self.akcii
         return self.successor(state).keys()
 
     def result(self, state, action):
+        if self.bitboard:
+            return state ^ self.masks[self.akcija_indeks[action]]
         possible = self.successor(state)
         return possible[action]
 
+    def to_bitboard(self, state):
+        """Врати ја состојбата state како цел број од n*n битови, каде
+        полето (i, j) е битот i*n+j.
+
+        :param state: дадена состојба
+        :return: состојбата како bitboard
+        :rtype: int
+        """
+        if self.bitboard:
+            return state
+        bits = 0
+        k = 0
+        for row in state:
+            for e in row:
+                if e:
+                    bits |= 1 << k
+                k += 1
+        return bits
+
+    def state_key(self, state):
+        if self.symmetric:
+            return self.canonical(self.to_bitboard(state))
+        return self.to_bitboard(state)
+
+    def key_state(self, key):
+        if self.symmetric:
+            raise ValueError("канонскиот клуч не ја определува состојбата")
+        if self.bitboard:
+            return key
+        n = self.n
+        return [[key >> (i * n + j) & 1 for j in range(0, n)] for i in range(0, n)]
+
+    def canonical(self, bits):
+        """Врати ја најмалата од 8-те ротации и рефлексии на таблата bits.
+        Правилата и целта се симетрични, па симетричните табли се на исто
+        растојание до целта и доволно е да се чува само една од нив.
+
+        :param bits: табла како bitboard
+        :return: канонската форма на таблата
+        :rtype: int
+        """
+        n = self.n
+        row_mask = (1 << n) - 1
+        rows = [bits >> (i * n) & row_mask for i in range(0, n)]
+        best = bits
+        for tables in self.row_tables:
+            image = 0
+            for table, row in zip(tables, rows):
+                image |= table[row]
+            if image < best:
+                best = image
+        return best
+
+    def map_actions(self, actions, from_state, to_state):
+        # притискањето на полето k во сликата на таблата е притискање на
+        # сликата на полето k, па акциите се пресликуваат со истата симетрија
+        source, target = self.to_bitboard(from_state), self.to_bitboard(to_state)
+        for permutation in self.permutations:
+            image = 0
+            for k in range(0, self.n * self.n):
+                if source >> k & 1:
+                    image |= 1 << permutation[k]
+            if image == target:
+                return [self.akcii[permutation[self.akcija_indeks[action]]] for action in actions]
+        raise ValueError("состојбите не се симетрични")
+
+    def instance_key(self):
+        # целта е секогаш полна табла, па примерокот е определен од n и
+        # почетната табла
+        return 'CrnoBelo:%d:%x' % (self.n, self.to_bitboard(self.initial))
+
+    def transitions(self, state):
+        if self.bitboard:
+            return [(akcija, state ^ mask, 1) for akcija, mask in zip(self.akcii, self.masks)]
+        return super().transitions(state)
+
+    def reverse_transitions(self, state):
+        # секое притискање е самото себеси инверзно
+        return self.transitions(state)
+
     def path_cost(self, c, state1, action, state2):
         """Врати ја цената на решавачкиот пат кој пристигнува во состојбата
         state2 од состојбата state1 преку акцијата action, претпоставувајќи
@@ -577,18 +280,415 @@ class CrnoBelo(Problem):
         """
         return 1
 
+    def h(self, node):
+        """Секое притискање менува најмногу 5 полиња, па за да се поправат
+        сите нули се потребни барем ceil(нули / 5) потези.
 
+        :param node: даден јазел
+        :return: долна граница на бројот на потези до целта
+        :rtype: int
+        """
+        if self.bitboard:
+            zeros = (self.goal ^ node.state).bit_count()
+        else:
+            zeros = sum(row.count(0) for row in node.state)
+        return (zeros + 4) // 5
+
+
+# најголема димензија на нултиот простор за која gf2_solve го бара
+# минималното решение; без numpy се пребарува Gray код, па границата е помала
+MAX_NULLITY = 24 if np is not None else 16
+
+
+class NotMinimalError(ValueError):
+    """Системот на gf2_solve има решенија, но нултиот простор е преголем за
+    да се пронајде она со најмалку притисоци. Атрибутот presses (односно
+    node кај gf2_search) е најдоброто пронајдено решение."""
+
+    def __init__(self, message, presses=None, node=None):
+        super().__init__(message)
+        self.presses = presses
+        self.node = node
+
+
+def gf2_solve(n, state, max_nullity=MAX_NULLITY):
+    """Реши ја таблата state (bitboard од n*n битови) како систем линеарни
+    равенки над GF(2). Притисоците во првата редица се непознати x_0..x_{n-1};
+    секоја следна редица е афина функција од нив (битовите 0..n-1 се
+    коефициентите, а битот n е константата), бидејќи само притисокот под
+    полето (i, j) може уште да го поправи. Условите за последната редица
+    даваат n x n систем кој се решава со Гаусова елиминација врз битови.
+    Ако системот е сингуларен, од сите решенија (нултиот простор) се враќа
+    она со најмалку притисоци (види _min_presses).
+
+    :param n: големина на таблата
+    :param state: почетна состојба како bitboard
+    :param max_nullity: најголема димензија на нултиот простор која се
+                        пребарува; над неа се фрла NotMinimalError
+    :return: сортирана листа од индекси i*n+j на полињата што се притискаат,
+             или None ако таблата нема решение
+    :rtype: list
+    :raises NotMinimalError: ако нултиот простор е поголем од max_nullity
+    """
+    const = 1 << n
+    target = ((1 << n * n) - 1) ^ state
+
+    # cur[j] е афината форма за притисокот на полето (i, j) во тековната редица
+    prev = [0] * n
+    cur = [1 << j for j in range(0, n)]
+    for i in range(0, n):
+        nxt = []
+        for j in range(0, n):
+            f = prev[j] ^ cur[j]
+            if j > 0:
+                f ^= cur[j - 1]
+            if j < n - 1:
+                f ^= cur[j + 1]
+            if target >> (i * n + j) & 1:
+                f ^= const
+            nxt.append(f)
+        if i < n - 1:
+            prev, cur = cur, nxt
+        else:
+            # притисокот под последната редица не постои, па nxt мора да е 0
+            equations = nxt
+
+    # Гаусова елиминација (reduced row echelon form)
+    pivots = []
+    rank = 0
+    for col in range(0, n):
+        bit = 1 << col
+        for r in range(rank, n):
+            if equations[r] & bit:
+                break
+        else:
+            continue
+        equations[rank], equations[r] = equations[r], equations[rank]
+        row = equations[rank]
+        for r in range(0, n):
+            if r != rank and equations[r] & bit:
+                equations[r] ^= row
+        pivots.append(col)
+        rank += 1
+
+    for r in range(rank, n):
+        if equations[r]:
+            return None
+
+    particular = const
+    for r, col in enumerate(pivots):
+        if equations[r] & const:
+            particular |= 1 << col
+    null_space = []
+    for col in sorted(set(range(0, n)) - set(pivots)):
+        vector = 1 << col
+        for r, pivot in enumerate(pivots):
+            if equations[r] >> col & 1:
+                vector |= 1 << pivot
+        null_space.append(vector)
+
+    # притисоците за прва редица x се добиваат со бркање редица по редица,
+    # со истата рекурзија како формите (константата ја внесува target)
+    mask = const - 1
+    rows = [target >> (i * n) & mask for i in range(0, n)]
+
+    def presses(x):
+        bits = 0
+        prev, cur = 0, x & mask
+        for i in range(0, n):
+            bits |= cur << (i * n)
+            nxt = prev ^ cur ^ (cur << 1 & mask) ^ (cur >> 1)
+            if x & const:
+                nxt ^= rows[i]
+            prev, cur = cur, nxt
+        return bits
+
+    best = presses(particular)
+    if best == 0:
+        # таблата е веќе решена; нула притисоци е секогаш минимално
+        return []
+    if len(null_space) > max_nullity:
+        raise NotMinimalError("нултиот простор има димензија %d > %d; решението не е минимално"
+                              % (len(null_space), max_nullity),
+                              presses=[k for k in range(0, n * n) if best >> k & 1])
+    if null_space:
+        best = _min_presses(n * n, best, [presses(vector) for vector in null_space])
+
+    return [k for k in range(0, n * n) if best >> k & 1]
+
+
+def _min_presses(cells, particular, null_presses):
+    """Најмалото по број на битови од particular ^ (XOR на подмножество од
+    null_presses). Без numpy се минуваат сите подмножества со Gray код.
+
+    Со numpy, полето k е притиснато за изборот c (d бита) ако
+    a_k . c ^ b_k = 1, каде a_k се битовите k од null_presses, а b_k битот k
+    од particular. Бројот на притисоци е (cells - W(c)) / 2, каде
+    W(c) = sum_a h[a] (-1)^(a . c), а h[a] е збирот на (-1)^b_k по полињата
+    со a_k = a; W за сите 2^d избори е Walsh-Hadamard трансформација на h
+    (d 2^d операции наместо cells 2^d).
+    """
+    d = len(null_presses)
+    if np is None:
+        best = current = particular
+        for g in range(1, 1 << d):
+            current ^= null_presses[(g & -g).bit_length() - 1]
+            if current.bit_count() < best.bit_count():
+                best = current
+        return best
+
+    size = (cells + 7) // 8
+
+    def bits(x):
+        return np.unpackbits(np.frombuffer(x.to_bytes(size, 'little'), np.uint8), bitorder='little')
+
+    a = np.zeros(size * 8, np.int64)
+    for i, vector in enumerate(null_presses):
+        a |= bits(vector).astype(np.int64) << i
+    # float32 е точен, бидејќи |W| <= cells < 2^24
+    h = np.zeros(1 << d, np.float32)
+    np.add.at(h, a[:cells], 1 - 2 * bits(particular)[:cells].astype(np.float32))
+
+    # трансформацијата се прави по 4 бита наеднаш, како множење со 16 x 16
+    # Адамарова матрица
+    for low in range(0, d, 4):
+        step = min(4, d - low)
+        hadamard = np.ones((1, 1), np.float32)
+        for _ in range(0, step):
+            hadamard = np.block([[hadamard, hadamard], [hadamard, -hadamard]])
+        h = np.matmul(hadamard, h.reshape(-1, 1 << step, 1 << low)).reshape(-1)
+
+    choice = int(h.argmax())
+    best = particular
+    for i in range(0, d):
+        if choice >> i & 1:
+            best ^= null_presses[i]
+    return best
+
+
+def gf2_search(problem):
+    """Реши го проблемот CrnoBelo со gf2_solve, без пребарување. Враќа
+    јазел чиј пат ги содржи притисоците, како и функциите за пребарување.
+    Ако минималноста не може да се гарантира, се фрла NotMinimalError чиј
+    атрибут node е јазелот со најдоброто пронајдено решение.
+
+    :param problem: даден проблем од тип CrnoBelo
+    :return: Node
+    """
+    def path(presses):
+        node = Node(problem.initial)
+        for k in presses:
+            node = node.child_node(problem, problem.akcii[k])
+        return node
+
+    try:
+        presses = gf2_solve(problem.n, problem.to_bitboard(problem.initial))
+    except NotMinimalError as e:
+        raise NotMinimalError(str(e), e.presses, path(e.presses))
+    if presses is None:
+        return None
+    return path(presses)
+
+
+def chase_lights_solve(n, state):
+    """Реши ја таблата state (bitboard од n*n битови) со "бркање на
+    светлата" надолу. Се пробуваат сите 2^n можни притисоци во првата
+    редица; секоја следна редица се притиска точно под полињата кои во
+    претходната редица останале 0, па е целосно определена. Од притисоците
+    по кои и последната редица е полна се враќа оној со најмалку притисоци.
+    Редиците се чуваат како цели броеви од n бита.
+
+    :param n: големина на таблата
+    :param state: почетна состојба како bitboard
+    :return: сортирана листа од индекси i*n+j на полињата што се притискаат,
+             или None ако таблата нема решение
+    :rtype: list
+    """
+    full = (1 << n) - 1
+    start = [(state >> (i * n)) & full for i in range(0, n)]
+    best = None
+    best_count = n * n + 1
+
+    for first in range(0, 1 << n):
+        rows = start[:]
+        pressed = [first]
+        count = first.bit_count()
+        press = first
+        for i in range(0, n):
+            rows[i] ^= press ^ (press << 1 & full) ^ (press >> 1)
+            if i > 0:
+                rows[i - 1] ^= press
+            if i < n - 1:
+                rows[i + 1] ^= press
+                press = ~rows[i] & full
+                pressed.append(press)
+                count += press.bit_count()
+                if count >= best_count:
+                    break
+        else:
+            if rows[n - 1] == full:
+                best = pressed
+                best_count = count
+
+    if best is None:
+        return None
+    return [i * n + j for i in range(0, n) for j in range(0, n) if best[i] >> j & 1]
 
 
+def chase_lights_search(problem):
+    """Реши го проблемот CrnoBelo со chase_lights_solve. Враќа јазел чиј
+    пат ги содржи притисоците, како и функциите за пребарување.
 
-n = int(input())
-polinja = list(map(int, input().split(',')))
+    :param problem: даден проблем од тип CrnoBelo
+    :return: Node
+    """
+    presses = chase_lights_solve(problem.n, problem.to_bitboard(problem.initial))
+    if presses is None:
+        return None
+    node = Node(problem.initial)
+    for k in presses:
+        node = node.child_node(problem, problem.akcii[k])
+    return node
 
-reprezentacija = CrnoBelo(n, polinja)
 
-print(breadth_first_graph_search(reprezentacija).solution())
+ENGINES = {'bfs': breadth_first_graph_search, 'bidir': bidirectional_breadth_first_search,
+           'external': external_breadth_first_search, 'parallel': parallel_breadth_first_search,
+           'ida': ida_star_search, 'gf2': gf2_search, 'chase': chase_lights_search}
 
-# a = [1, 2, 3]
-# b = a.copy()
-# b[0] = 5
-# print(a)
\ No newline at end of file
+
+def random_board(n, presses, rng):
+    """Врати решлива табла: од полната табла, притисни presses случајни полиња.
+
+    :param n: големина на таблата
+    :param presses: број на случајни притисоци
+    :param rng: random.Random
+    :return: листа од n*n нули и единици
+    :rtype: list
+    """
+    board = [1] * (n * n)
+    for _ in range(0, presses):
+        i, j = rng.randrange(n), rng.randrange(n)
+        for di, dj in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)):
+            if 0 <= i + di < n and 0 <= j + dj < n:
+                board[(i + di) * n + j + dj] ^= 1
+    return board
+
+
+def benchmark_engines(sizes=range(3, 11), bfs_max_n=4, boards=5, seed=0):
+    """Споредба на breadth_first_graph_search, bidirectional_breadth_first_search,
+    chase_lights_search и gf2_search на решливи табли со n*n/3 случајни
+    притисоци. Пребарувањата во ширина се мерат само до bfs_max_n, бидејќи
+    просторот на состојби е 2^(n*n).
+
+    :param sizes: големини на таблата
+    :param bfs_max_n: најголемо n за кое се мери BFS
+    :param boards: број на табли по големина
+    :param seed: seed за генерирање на таблите
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    for n in sizes:
+        problems = [CrnoBelo(n, random_board(n, n * n // 3, rng), bitboard=True)
+                    for _ in range(0, boards)]
+        for name in ('bfs', 'bidir', 'chase', 'gf2'):
+            if name in ('bfs', 'bidir') and n > bfs_max_n:
+                continue
+            start = time.perf_counter()
+            lengths = [len(ENGINES[name](problem).solution()) for problem in problems]
+            elapsed = (time.perf_counter() - start) / boards
+            print("n=%-3d %-6s %10.4f s/board   presses: %s" % (n, name, elapsed, lengths))
+
+
+def benchmark_symmetry(sizes=(3, 4), boards=5, seed=0):
+    """Споредба на бројот на експандирани состојби и времето на
+    breadth_first_graph_search, bidirectional_breadth_first_search и
+    astar_search со и без симетрии, на
+    решливи табли со n*n/3 случајни притисоци и на една нерешлива табла
+    (ако постои), кај која се пребарува целиот простор на состојби.
+
+    :param sizes: големини на таблата
+    :param boards: број на решливи табли по големина
+    :param seed: seed за генерирање на таблите
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    for n in sizes:
+        initials = [random_board(n, n * n // 3, rng) for _ in range(0, boards)]
+        for _ in range(0, 100):
+            board = [rng.randrange(2) for _ in range(0, n * n)]
+            if gf2_solve(n, CrnoBelo(n, board, bitboard=True).initial) is None:
+                initials.append(board)
+                break
+        for searcher in (breadth_first_graph_search, bidirectional_breadth_first_search, astar_search):
+            for symmetric in (False, True):
+                expanded = 0
+                start = time.perf_counter()
+                for initial in initials:
+                    p = InstrumentedProblem(CrnoBelo(n, initial, bitboard=True, symmetric=symmetric))
+                    searcher(p)
+                    expanded += p.succs
+                elapsed = time.perf_counter() - start
+                print("n=%-3d %-34s symmetric=%-5s expanded: %8d  %8.3f s"
+                      % (n, searcher.__name__, symmetric, expanded, elapsed))
+
+
+def benchmark_parallel(n=5, presses=8, max_processes=None, seed=2):
+    """Скалирање на parallel_breadth_first_search од 1 до max_processes
+    процеси, споредено со breadth_first_graph_search, на една решлива
+    табла со presses случајни притисоци.
+
+    :param n: големина на таблата
+    :param presses: број на случајни притисоци
+    :param max_processes: најголем број на процеси (подразбирливо бројот на јадра)
+    :param seed: seed за генерирање на таблата
+    """
+    import os
+    import random
+    import time
+
+    problem = CrnoBelo(n, random_board(n, presses, random.Random(seed)), bitboard=True)
+    start = time.perf_counter()
+    length = len(breadth_first_graph_search(problem).solution())
+    print("serial BFS       %8.3f s   presses: %d" % (time.perf_counter() - start, length))
+    base = None
+    for processes in range(1, (max_processes or os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        length = len(parallel_breadth_first_search(problem, processes).solution())
+        elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print("parallel p=%-3d  %8.3f s   speedup: %5.2fx   presses: %d" % (processes, elapsed, base / elapsed, length))
+
+
+BENCHMARKS = {'fifo': benchmark_fifo, 'engines': benchmark_engines, 'symmetry': benchmark_symmetry,
+              'parallel': benchmark_parallel}
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        for name in sys.argv[2:] or BENCHMARKS:
+            BENCHMARKS[name]()
+        return
+
+    n = int(input())
+    polinja = list(map(int, input().split(',')))
+
+    reprezentacija = CrnoBelo(n, polinja, bitboard=True)
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'compare':
+        compare_searchers(reprezentacija, [breadth_first_graph_search, uniform_cost_search,
+                                           astar_search, weighted_astar_search,
+                                           greedy_best_first_graph_search])
+    else:
+        engine = ENGINES[sys.argv[1]] if len(sys.argv) > 1 else breadth_first_graph_search
+        try:
+            print(engine(reprezentacija).solution())
+        except NotMinimalError as e:
+            print(e.node.solution())
+            print("предупредување: %s" % e, file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
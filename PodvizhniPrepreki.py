@@ -1,639 +1,761 @@
+import hashlib
+import json
+import math
+import pickle
+import sys
+import time
+from array import array
+from collections import OrderedDict, deque
 
-#Starter kod
-import bisect
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
+from searching_framework import (Problem, Node, breadth_first_graph_search, uniform_cost_search,
+                                 astar_search, weighted_astar_search,
+                                 greedy_best_first_graph_search, compare_searchers)
 
-"""
-Дефинирање на класа за структурата на проблемот кој ќе го решаваме со пребарување.
-Класата Problem е апстрактна класа од која правиме наследување за дефинирање на основните 
-карактеристики на секој проблем што сакаме да го решиме
-"""
 
+# Vasiot kod pisuvajte go pod ovoj komentar
 
-class Problem:
-    def __init__(self, initial, goal=None):
-        self.initial = initial
-        self.goal = goal
 
-    def successor(self, state):
-        """За дадена состојба, врати речник од парови {акција : состојба}
-        достапни од оваа состојба. Ако има многу следбеници, употребете
-        итератор кој би ги генерирал следбениците еден по еден, наместо да
-        ги генерирате сите одеднаш.
+class Prepreka:
 
-        :param state: дадена состојба
-        :return:  речник од парови {акција : состојба} достапни од оваа
-                  состојба
-        :rtype: dict
-        """
-        raise NotImplementedError
+    # koristi goren lev agol za pretstavuvanje na pozicija
 
-    def actions(self, state):
-        """За дадена состојба state, врати листа од сите акции што може да
-        се применат над таа состојба
+    # Preprekata e nepromenliva vrednost: dve prepreki so isti koordinati,
+    # prostor i nasoka se ednakvi i imaat ist hash. Site prepreki se
+    # internirani vo Prepreka.instanci, pa istata polozhba e sekogash istiot
+    # objekt, a move() i polinjata za hitChoveche se presmetuvaat ednash.
 
-        :param state: дадена состојба
-        :return: листа на акции
-        :rtype: list
-        """
-        return self.successor(state).keys()
+    __slots__ = ('preprekaX1', 'preprekaY1', 'preprekaX2', 'preprekaY2',
+                 'prostorX1', 'prostorY1', 'prostorX2', 'prostorY2',
+                 'deltaX', 'deltaY', '_kluch', '_hash', '_sledna', '_polinja')
 
-    def result(self, state, action):
-        """За дадена состојба state и акција action, врати ја состојбата
-        што се добива со примена на акцијата над состојбата
+    instanci = {}
 
-        :param state: дадена состојба
-        :param action: дадена акција
-        :return: резултантна состојба
+    def __new__(cls, preprekaX1, preprekaY1, preprekaX2, preprekaY2, prostorX1, prostorY1, prostorX2, prostorY2, deltaX, deltaY):
         """
-        possible = self.successor(state)
-        return possible[action]
-
-
-    def goal_test(self, state):
-        """Врати True ако state е целна состојба. Даденава имплементација
-        на методот директно ја споредува state со self.goal, како што е
-        специфицирана во конструкторот. Имплементирајте го овој метод ако
-        проверката со една целна состојба self.goal не е доволна.
-
-        :param state: дадена состојба
-        :return: дали дадената состојба е целна состојба
-        :rtype: bool
+        :param preprekaX1: redica vo koja e goren lev agol na preprekata
+        :param preprekaY1: kolona vo koja e goren lev agol na preprekata
+        :param preprekaX2: redica vo koja e dolniot desen agol na preprekata
+        :param preprekaY2: kolona vo koja e dolniot desen agol na preprekata
+        :param prostorX1: redica vo koja e goren lev agol na prostorot vo koj mozhe da se dvizhi
+        :param prostorY1: kolona vo koja e goren lev agol na prostorot vo koj mozhe da se dvizhi
+        :param prostorX2: redica vo koja e dolniot desen agol na prostorot vo koj mozhe da se dvizhi
+        :param prostorY2: kolona vo koja e dolniot desen agol na prostorot vo koj mozhe da se dvizhi
+        :param deltaX: za eden moment kolku pozicii po x-oska se pridvizhuva
+        :param deltaY: vo eden moment kolku pozicii po y-oska se pridvizhuva
         """
-        return state == self.goal
+        kluch = (preprekaX1, preprekaY1, preprekaX2, preprekaY2,
+                 prostorX1, prostorY1, prostorX2, prostorY2, deltaX, deltaY)
+        prepreka = cls.instanci.get(kluch)
+        if prepreka is None:
+            prepreka = object.__new__(cls)
+            for ime, vrednost in zip(cls.__slots__, kluch):
+                object.__setattr__(prepreka, ime, vrednost)
+            object.__setattr__(prepreka, '_kluch', kluch)
+            object.__setattr__(prepreka, '_hash', hash(kluch))
+            object.__setattr__(prepreka, '_sledna', None)
+            object.__setattr__(prepreka, '_polinja', None)
+            cls.instanci[kluch] = prepreka
+        return prepreka
+
+    def __setattr__(self, ime, vrednost):
+        raise AttributeError("Prepreka e nepromenliva")
+
+    def __reduce__(self):
+        return Prepreka, self._kluch
 
-    def path_cost(self, c, state1, action, state2):
-        """Врати ја цената на решавачкиот пат кој пристигнува во состојбата
-        state2 од состојбата state1 преку акцијата action, претпоставувајќи
-        дека цената на патот до состојбата state1 е c. Ако проблемот е таков
-        што патот не е важен, оваа функција ќе ја разгледува само состојбата
-        state2. Ако патот е важен, ќе ја разгледува цената c и можеби и
-        state1 и action. Даденава имплементација му доделува цена 1 на секој
-        чекор од патот.
-
-        :param c: цена на патот до состојбата state1
-        :param state1: дадена моментална состојба
-        :param action: акција која треба да се изврши
-        :param state2: состојба во која треба да се стигне
-        :return: цена на патот по извршување на акцијата
-        :rtype: float
+    def move(self):
         """
-        return c + 1
 
-    def value(self):
-        """За проблеми на оптимизација, секоја состојба си има вредност. 
-        Hill-climbing и сличните алгоритми се обидуваат да ја максимизираат
-        оваа вредност.
-
-        :return: вредност на состојба
-        :rtype: float
+        :return: slednata polozhba na preprekata (kanonskiot objekt od tipot Prepreka)
         """
-        raise NotImplementedError
-
-
-"""
-Дефинирање на класата за структурата на јазел од пребарување.
-Класата Node не се наследува
-"""
-
-
-class Node:
-    def __init__(self, state, parent=None, action=None, path_cost=0):
-        """Креирај јазол од пребарувачкото дрво, добиен од parent со примена
-        на акцијата action
+        if self._sledna is not None:
+            return self._sledna
 
-        :param state: моментална состојба (current state)
-        :param parent: родителска состојба (parent state)
-        :param action: акција (action)
-        :param path_cost: цена на патот (path cost)
-        """
-        self.state = state
-        self.parent = parent
-        self.action = action
-        self.path_cost = path_cost
-        self.depth = 0  # search depth
-        if parent:
-            self.depth = parent.depth + 1
-
-    def __repr__(self):
-        return "<Node %s>" % (self.state,)
-
-    def __lt__(self, node):
-        return self.state < node.state
-
-    def expand(self, problem):
-        """Излистај ги јазлите достапни во еден чекор од овој јазол.
-
-        :param problem: даден проблем
-        :return: листа на достапни јазли во еден чекор
-        :rtype: list(Node)
-        """
-        return [self.child_node(problem, action)
-                for action in problem.actions(self.state)]
+        deltaX = self.deltaX
+        deltaY = self.deltaY
 
-    def child_node(self, problem, action):
-        """Дете јазел
+        if self.preprekaX1 == self.prostorX1\
+            or self.preprekaX2 == self.prostorX2\
+            or self.preprekaX1 == self.prostorX2\
+            or self.preprekaX2 == self.prostorX1:
+                deltaX *= -1
 
-        :param problem: даден проблем
-        :param action: дадена акција
-        :return: достапен јазел според дадената акција
-        :rtype: Node
-        """
-        next_state = problem.result(self.state, action)
-        return Node(next_state, self, action,
-                    problem.path_cost(self.path_cost, self.state,
-                                      action, next_state))
+        if self.preprekaY1 == self.prostorY1 \
+            or self.preprekaY2 == self.prostorY2\
+            or self.preprekaY1 == self.prostorY2\
+            or self.preprekaY1 == self.prostorY1:
+            deltaY *= -1
 
-    def solution(self):
-        """Врати ја секвенцата од акции за да се стигне од коренот до овој јазол.
+        sledna = Prepreka(self.preprekaX1 + deltaX, self.preprekaY1 + deltaY,
+                          self.preprekaX2 + deltaX, self.preprekaY2 + deltaY,
+                          self.prostorX1, self.prostorY1, self.prostorX2, self.prostorY2,
+                          deltaX, deltaY)
+        object.__setattr__(self, '_sledna', sledna)
+        return sledna
 
-        :return: секвенцата од акции
-        :rtype: list
+    def polinja(self):
         """
-        return [node.action for node in self.path()[1:]]
-
-    def solve(self):
-        """Врати ја секвенцата од состојби за да се стигне од коренот до овој јазол.
-
-        :return: листа од состојби
-        :rtype: list
+        :return: mnozhestvo od polinjata (redica, kolona) pod preprekata
         """
-        # changed to -1
-        return [node.state for node in self.path()[-1]]
+        if self._polinja is None:
+            object.__setattr__(self, '_polinja', frozenset(
+                (redica, kolona)
+                for redica in range(self.preprekaX1, self.preprekaX2 + 1)
+                for kolona in range(self.preprekaY1, self.preprekaY2 + 1)))
+        return self._polinja
 
-    def path(self):
-        """Врати ја листата од јазли што го формираат патот од коренот до овој јазол.
-
-        :return: листа од јазли од патот
-        :rtype: list(Node)
-        """
-        x, result = self, []
-        while x:
-            result.append(x)
-            x = x.parent
-        result.reverse()
-        return result
+    def hitChoveche(self, choveche):
+        return (choveche[0], choveche[1]) in self.polinja()
 
-    """Сакаме редицата од јазли кај breadth_first_search или 
-    astar_search да не содржи состојби - дупликати, па јазлите што
-    содржат иста состојба ги третираме како исти. [Проблем: ова може
-    да не биде пожелно во други ситуации.]"""
+    def __str__(self):
+        l = [self.preprekaX1, self.preprekaY1, self.preprekaX2, self.preprekaY2]
+        return str(l)
 
     def __eq__(self, other):
-        return isinstance(other, Node) and self.state == other.state
+        if not isinstance(other, Prepreka):
+            return NotImplemented
+        return self._kluch == other._kluch
 
     def __hash__(self):
-        return hash(self.state)
-
+        return self._hash
 
-"""
-Дефинирање на помошни структури за чување на листата на генерирани, но непроверени јазли
-"""
 
+# Opis na mapa: "mapa" e lista od redici, kade '.' e slobodno pole, a '#' pole
+# nadvor od mapata; "prepreki" e lista od prepreki, sekoja so pravoagolnik
+# [x1, y1, x2, y2] (goren lev i dolen desen agol), prostor [x1, y1, x2, y2] vo
+# koj se dvizhi i pomestuvanje [deltaX, deltaY] vo eden moment. Mapata mozhe
+# da se dade kako rechnik ili kako pateka do JSON datoteka so istiot oblik.
 
-class Queue:
-    """Queue е апстрактна класа / интерфејс. Постојат 3 типа:
-        Stack(): Last In First Out Queue (стек).
-        FIFOQueue(): First In First Out Queue (редица).
-        PriorityQueue(order, f): Queue во сортиран редослед (подразбирливо,од најмалиот кон
-                                 најголемиот јазол).
-    """
+# najmnogu fazi vo zaednichkiot raspored na preprekite (NZS od periodite);
+# za poveke fazi se chuvaat samo polozhbite na sekoja prepreka posebno,
+# a blokiranite polinja se presmetuvaat pri ekspanzijata (RasporedPoPrepreki)
+MAX_FAZI = 4096
 
-    def __init__(self):
-        raise NotImplementedError
+# kolku od poslednite presmetani fazi chuva RasporedPoPrepreki; granicata
+# na prebaruvanjeto e vo nekolku posledovatelni fazi
+KESH_FAZI = 64
 
-    def append(self, item):
-        """Додади го елементот item во редицата
+MAPA_OSNOVNA = {
+    'mapa': ['......#####'] * 5 + ['...........'] * 6,
+    'prepreki': [
+        {'prepreka': [2, 2, 2, 3], 'prostor': [2, 0, 2, 5], 'delta': [0, -1]},
+        {'prepreka': [7, 2, 8, 3], 'prostor': [5, 0, 10, 5], 'delta': [-1, 1]},
+        {'prepreka': [7, 8, 8, 8], 'prostor': [5, 8, 10, 8], 'delta': [1, 0]},
+    ],
+}
 
-        :param item: даден елемент
-        :return: None
-        """
-        raise NotImplementedError
-
-    def extend(self, items):
-        """Додади ги елементите items во редицата
-
-        :param items: дадени елементи
-        :return: None
-        """
-        raise NotImplementedError
-
-    def pop(self):
-        """Врати го првиот елемент од редицата
-
-        :return: прв елемент
-        """
-        raise NotImplementedError
-
-    def __len__(self):
-        """Врати го бројот на елементи во редицата
-
-        :return: број на елементи во редицата
-        :rtype: int
-        """
-        raise NotImplementedError
-
-    def __contains__(self, item):
-        """Проверка дали редицата го содржи елементот item
-
-        :param item: даден елемент
-        :return: дали queue го содржи item
-        :rtype: bool
-        """
-        raise NotImplementedError
-
-
-class Stack(Queue):
-    """Last-In-First-Out Queue."""
-
-    def __init__(self):
-        self.data = []
-
-    def append(self, item):
-        self.data.append(item)
-
-    def extend(self, items):
-        self.data.extend(items)
-
-    def pop(self):
-        return self.data.pop()
-
-    def __len__(self):
-        return len(self.data)
-
-    def __contains__(self, item):
-        return item in self.data
-
-
-class FIFOQueue(Queue):
-    """First-In-First-Out Queue."""
-
-    def __init__(self):
-        self.data = []
-
-    def append(self, item):
-        self.data.append(item)
-
-    def extend(self, items):
-        self.data.extend(items)
-
-    def pop(self):
-        return self.data.pop(0)
 
-    def __len__(self):
-        return len(self.data)
-
-    def __contains__(self, item):
-        return item in self.data
-
-
-class PriorityQueue(Queue):
-    """Редица во која прво се враќа минималниот (или максималниот) елемент
-    (како што е определено со f и order). Оваа структура се користи кај
-    информирано пребарување"""
-    """"""
-
-    def __init__(self, order=min, f=lambda x: x):
-        """
-        :param order: функција за подредување, ако order е min, се враќа елементот
-                      со минимална f(x); ако order е max, тогаш се враќа елементот
-                      со максимална f(x).
-        :param f: функција f(x)
-        """
-        assert order in [min, max]
-        self.data = []
-        self.order = order
-        self.f = f
-
-    def append(self, item):
-        bisect.insort_right(self.data, (self.f(item), item))
-
-    def extend(self, items):
-        for item in items:
-            bisect.insort_right(self.data, (self.f(item), item))
-
-    def pop(self):
-        if self.order == min:
-            return self.data.pop(0)[1]
-        return self.data.pop()[1]
-
-    def __len__(self):
-        return len(self.data)
-
-    def __contains__(self, item):
-        return any(item == pair[1] for pair in self.data)
-
-    def __getitem__(self, key):
-        for _, item in self.data:
-            if item == key:
-                return item
-
-    def __delitem__(self, key):
-        for i, (value, item) in enumerate(self.data):
-            if item == key:
-                self.data.pop(i)
-
-import sys
-
-
-"""
-Неинформирано пребарување во рамки на дрво.
-Во рамки на дрвото не разрешуваме јамки.
-"""
-
-
-def tree_search(problem, fringe):
-    """ Пребарувај низ следбениците на даден проблем за да најдеш цел.
-
-    :param problem: даден проблем
-    :param fringe:  празна редица (queue)
-    :return: Node
-    """
-    fringe.append(Node(problem.initial))
-    while fringe:
-        node = fringe.pop()
-        # print(node.state)
-        if problem.goal_test(node.state):
-            return node
-        fringe.extend(node.expand(problem))
-    return None
-
-
-def breadth_first_tree_search(problem):
-    """Експандирај го прво најплиткиот јазол во пребарувачкото дрво.
-
-    :param problem: даден проблем
-    :return: Node
+def sosedi_na_pole(redici, koloni, redica, kolona):
     """
-    return tree_search(problem, FIFOQueue())
-
-
-def depth_first_tree_search(problem):
-    """Експандирај го прво најдлабокиот јазол во пребарувачкото дрво.
-
-    :param problem:даден проблем
-    :return: Node
+    :return: lista od (akcija, pole, redica, kolona) za sosedite na poleto
+             (redica, kolona) vo mrezhata redici x koloni; poleto mozhe i
+             samoto da e nadvor od mrezhata
     """
-    return tree_search(problem, Stack())
+    return [(akcija, red * koloni + kol, red, kol)
+            for akcija, red, kol in (('Desno', redica, kolona + 1), ('Dolu', redica + 1, kolona),
+                                     ('Levo', redica, kolona - 1), ('Gore', redica - 1, kolona))
+            if 0 <= red < redici and 0 <= kol < koloni]
 
 
-"""
-Неинформирано пребарување во рамки на граф
-Основната разлика е во тоа што овде не дозволуваме јамки, 
-т.е. повторување на состојби
-"""
-
-
-def graph_search(problem, fringe):
-    """Пребарувај низ следбениците на даден проблем за да најдеш цел.
-     Ако до дадена состојба стигнат два пата, употреби го најдобриот пат.
-
-    :param problem: даден проблем
-    :param fringe: празна редица (queue)
-    :return: Node
+def ucitaj_mapa(mapa):
     """
-    closed = set()
-    fringe.append(Node(problem.initial))
-    while fringe:
-        node = fringe.pop()
-        if problem.goal_test(node.state):
-            return node
-        # if node.state not in closed:
-        #     closed.add(node.state)
-        #     fringe.extend(node.expand(problem))
-
-        # fix na bug so navrakanje na ist state
-        # se sluchuva zaradi drugi memoriski adresi, a isti vrednosti na objektite od tipot Prepreka
-        # bez razlika shto imaat isti vrednosti, python gi sporeduva memoriski adresi
-        # mozhno e reshenie i so implementacija na funkcijata __eq__()
-        state = (node.state[0], (node.state[1].preprekaX1, node.state[1].preprekaY1), (node.state[2].preprekaX1, node.state[2].preprekaY1), (node.state[3].preprekaX1, node.state[3].preprekaY1))
-
-        if state not in closed:
-            closed.add(state)
-            fringe.extend(node.expand(problem))
-
-    return None
-
-
-def breadth_first_graph_search(problem):
-    """Експандирај го прво најплиткиот јазол во пребарувачкиот граф.
-
-    :param problem: даден проблем
-    :return: Node
+    :param mapa: rechnik so opis na mapa, pateka do JSON datoteka ili None
+                 za MAPA_OSNOVNA
+    :return: rechnik so opis na mapa
     """
-    return graph_search(problem, FIFOQueue())
+    if mapa is None:
+        return MAPA_OSNOVNA
+    if isinstance(mapa, str):
+        with open(mapa) as datoteka:
+            mapa = json.load(datoteka)
+    if not mapa['mapa'] or len({len(redica) for redica in mapa['mapa']}) != 1:
+        raise ValueError("site redici na mapata mora da imaat ista dolzhina")
+    return mapa
 
 
-def depth_first_graph_search(problem):
-    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф.
-
-    :param problem: даден проблем
-    :return: Node
-    """
-    return graph_search(problem, Stack())
+class PodvizniPrepreki(Problem):
+    # za prepreki chuvame goren lev agol
 
+    # podgotvenite mapi, spored opisot na mapata
+    mapi = {}
+
+    def __init__(self, choveche = (0, 0), kukja = (10, 10), mapa=None):
+        mapa = ucitaj_mapa(mapa)
+        self.mapa = mapa['mapa']
+        self.redici = len(self.mapa)
+        self.koloni = len(self.mapa[0])
+
+        # rasporedot na preprekite i sosedite zavisat samo od mapata, pa gi
+        # presmetuvame ednash za sekoja mapa
+        kluch = json.dumps(mapa, sort_keys=True)
+        if kluch not in PodvizniPrepreki.mapi:
+            PodvizniPrepreki.mapi[kluch] = self.podgotvi_mapa(mapa)
+        self.staticki, self.blokirani, self.sledna_faza, self.sosedi = PodvizniPrepreki.mapi[kluch]
+        self.mapa_hash = hashlib.sha1(kluch.encode()).hexdigest()
+        staticki = self.staticki
+
+        # rastojanie do kukjata po statichkata mapa (bez preprekite), za hevristikata
+        self.rastojanie = [float('inf')] * (self.redici * self.koloni)
+        if not self.ispadaChoveche(kukja):
+            cel = kukja[0] * self.koloni + kukja[1]
+            self.rastojanie[cel] = 0
+            neobraboteni = deque([cel])
+            while neobraboteni:
+                pole = neobraboteni.popleft()
+                for akcija, sosed, red, kol in self.sosedi[pole]:
+                    if not staticki >> sosed & 1 and self.rastojanie[sosed] == float('inf'):
+                        self.rastojanie[sosed] = self.rastojanie[pole] + 1
+                        neobraboteni.append(sosed)
+            # od pole nadvor od mapata (pochetok na '#') mozhe da se izleze
+            # na sosedno slobodno pole, pa i za nego hevristikata mora da e
+            # konechna: eden poteg i rastojanieto na najbliskiot slobodni sosed
+            for pole in range(0, self.redici * self.koloni):
+                if staticki >> pole & 1:
+                    self.rastojanie[pole] = min([self.rastojanie[sosed] for akcija, sosed, red, kol
+                                                 in self.sosedi[pole] if not staticki >> sosed & 1],
+                                                default=float('inf')) + 1
+
+        # sostojbata e (redica, kolona, faza)
+        initial = (choveche[0], choveche[1], 0)
+        super().__init__(initial, kukja)
 
-def depth_limited_search(problem, limit=50):
-    def recursive_dls(node, problem, limit):
-        """Помошна функција за depth limited"""
-        cutoff_occurred = False
-        if problem.goal_test(node.state):
-            return node
-        elif node.depth == limit:
-            return 'cutoff'
+    def podgotvi_mapa(self, mapa):
+        """
+        :param mapa: rechnik so opis na mapa
+        :return: (staticki, blokirani, sledna_faza, sosedi)
+        """
+        # preprekite se dvizhat nezavisno od chovecheto, pa nivniot raspored e
+        # periodichna funkcija od vremeto so period NZS od periodite na
+        # preprekite; rasporedot go presmetuvame ednash, a vo sostojbata ja
+        # chuvame samo fazata. Poleto (redica, kolona) e bitot
+        # redica * koloni + kolona, a za sekoja faza chuvame bitmapa od
+        # blokiranite polinja (nadvor od mapata ili pod prepreka)
+        staticki = 0
+        for redica in range(0, self.redici):
+            for kolona in range(0, self.koloni):
+                if self.mapa[redica][kolona] != '.':
+                    staticki |= 1 << (redica * self.koloni + kolona)
+
+        ciklusi = self.ciklusi(mapa['prepreki'])
+        fazi = max([mu for mu, niza in ciklusi], default=0) + math.lcm(*[len(niza) - mu for mu, niza in ciklusi])
+        if fazi > MAX_FAZI:
+            # NZS e prevelik za da se chuva bitmapa za sekoja faza
+            blokirani = RasporedPoPrepreki(staticki, [(mu, [self.bitmapa(prepreka) for prepreka in niza])
+                                                      for mu, niza in ciklusi])
+            sledna_faza = blokirani.sledna_faza
         else:
-            for successor in node.expand(problem):
-                result = recursive_dls(successor, problem, limit)
-                if result == 'cutoff':
-                    cutoff_occurred = True
-                elif result is not None:
-                    return result
-        if cutoff_occurred:
-            return 'cutoff'
-        return None
-
-    return recursive_dls(Node(problem.initial), problem, limit)
-
+            if np is not None:
+                zafateni, sledna_faza = self.raspored_numpy(mapa['prepreki'])
+            else:
+                zafateni, sledna_faza = self.raspored(mapa['prepreki'])
+            blokirani = [staticki | bitmapa for bitmapa in zafateni]
 
-def iterative_deepening_search(problem):
-    for depth in range(sys.maxsize):
-        result = depth_limited_search(problem, depth)
-        if result is not 'cutoff':
-            return result
+        # za sekoe pole, listata na sosedi vo mrezhata
+        sosedi = [sosedi_na_pole(self.redici, self.koloni, redica, kolona)
+                  for redica in range(0, self.redici) for kolona in range(0, self.koloni)]
 
+        return staticki, blokirani, sledna_faza, sosedi
 
-def uniform_cost_search(problem):
-    """Експандирај го прво јазолот со најниска цена во пребарувачкиот граф."""
-    return graph_search(problem, PriorityQueue(lambda a, b:
-                                               a.path_cost < b.path_cost))
-
-
-# Vasiot kod pisuvajte go pod ovoj komentar
+    def raspored(self, prepreki):
+        """Presmetaj go rasporedot na preprekite so Prepreka.move.
 
-
-class Prepreka:
-
-    # koristi goren lev agol za pretstavuvanje na pozicija
-
-
-    def __init__(self, preprekaX1, preprekaY1, preprekaX2, preprekaY2, prostorX1, prostorY1, prostorX2, prostorY2, deltaX, deltaY):
+        :param prepreki: lista od prepreki od opisot na mapata
+        :return: (zafateni, sledna_faza), kade zafateni[faza] e bitmapa od
+                 polinjata pod prepreki, a sledna_faza[faza] e slednata faza
         """
-        :param prostorX1: redica vo koja e goren lev agol na preprekata
-        :param prostorY1: kolona vo koja e goren lev agol na preprekata
-        :param prostorX2: redica vo koja e dolniot desen agol na preprekata
-        :param prostorY2: kolona vo koja e dolniot desen agol na preprekata
-        :param prostorX1: redica vo koja e goren lev agol na prostorot vo koj mozhe da se dvizhi
-        :param prostorY1: kolona vo koja e goren lev agol na prostorot vo koj mozhe da se dvizhi
-        :param prostorX2: redica vo koja e dolniot desen agol na prostorot vo koj mozhe da se dvizhi
-        :param prostorY2: kolona vo koja e dolniot desen agol na prostorot vo koj mozhe da se dvizhi
-        :param deltaX: za eden moment kolku pozicii po x-oska se pridvizhuva
-        :param deltaY: vo eden moment kolku pozicii po y-oska se pridvizhuva
+        ciklusi = self.ciklusi(prepreki)
+        pocetok = max([mu for mu, niza in ciklusi], default=0)
+        period = math.lcm(*[len(niza) - mu for mu, niza in ciklusi])
+
+        # preprekite se hashable, pa bitmapata za sekoja polozhba se presmetuva ednash
+        bitmapi = {}
+        zafateni = []
+        for t in range(0, pocetok + period):
+            bitmapa = 0
+            for mu, niza in ciklusi:
+                if t < mu:
+                    prepreka = niza[t]
+                else:
+                    prepreka = niza[mu + (t - mu) % (len(niza) - mu)]
+                if prepreka not in bitmapi:
+                    bitmapi[prepreka] = self.bitmapa(prepreka)
+                bitmapa |= bitmapi[prepreka]
+            zafateni.append(bitmapa)
+        return zafateni, list(range(1, pocetok + period)) + [pocetok]
+
+    def raspored_numpy(self, prepreki):
+        """Presmetaj go rasporedot na preprekite so NumPy: site prepreki se
+        pomestuvaat i odbivaat so edna vektorska operacija, a polinjata pod
+        site prepreki se presmetuvaat odednash. Rezultatot e ist kako kaj
+        raspored.
+
+        :param prepreki: lista od prepreki od opisot na mapata
+        :return: (zafateni, sledna_faza)
         """
-
-        self.preprekaX1 = preprekaX1
-        self.preprekaY1 = preprekaY1
-        self.preprekaX2 = preprekaX2
-        self.preprekaY2 = preprekaY2
-
-        self.deltaX = deltaX
-        self.deltaY = deltaY
-
-        self.prostorX1 = prostorX1
-        self.prostorY1 = prostorY1
-        self.prostorX2 = prostorX2
-        self.prostorY2 = prostorY2
-
-    def move(self):
+        pravoagolnici = np.array([p['prepreka'] for p in prepreki], dtype=np.int64).reshape(-1, 4)
+        prostori = np.array([p['prostor'] for p in prepreki], dtype=np.int64).reshape(-1, 4)
+        delti = np.array([p['delta'] for p in prepreki], dtype=np.int64).reshape(-1, 2)
+
+        videni = {}
+        zafateni = []
+        while True:
+            kluch = pravoagolnici.tobytes() + delti.tobytes()
+            if kluch in videni:
+                pocetok = videni[kluch]
+                break
+            if np.any((pravoagolnici[:, :2] < prostori[:, :2]) | (pravoagolnici[:, 2:] > prostori[:, 2:])):
+                raise ValueError("preprekata izleguva od svojot prostor")
+            videni[kluch] = len(zafateni)
+
+            # site pravoagolnici odednash, so 2D niza na razliki i kumulativni sumi
+            x1 = np.clip(pravoagolnici[:, 0], 0, self.redici)
+            y1 = np.clip(pravoagolnici[:, 1], 0, self.koloni)
+            x2 = np.clip(pravoagolnici[:, 2] + 1, 0, self.redici)
+            y2 = np.clip(pravoagolnici[:, 3] + 1, 0, self.koloni)
+            razliki = np.zeros((self.redici + 1, self.koloni + 1), dtype=np.int32)
+            np.add.at(razliki, (x1, y1), 1)
+            np.add.at(razliki, (x1, y2), -1)
+            np.add.at(razliki, (x2, y1), -1)
+            np.add.at(razliki, (x2, y2), 1)
+            polinja = razliki.cumsum(axis=0).cumsum(axis=1)[:-1, :-1] > 0
+            zafateni.append(int.from_bytes(np.packbits(polinja.ravel(), bitorder='little').tobytes(),
+                                           'little'))
+
+            # isti uslovi za odbivanje kako vo Prepreka.move
+            x1, y1, x2, y2 = pravoagolnici.T
+            px1, py1, px2, py2 = prostori.T
+            odbij_x = (x1 == px1) | (x2 == px2) | (x1 == px2) | (x2 == px1)
+            odbij_y = (y1 == py1) | (y2 == py2) | (y1 == py2)
+            delti = np.where(np.stack([odbij_x, odbij_y], axis=1), -delti, delti)
+            pravoagolnici = pravoagolnici + delti[:, [0, 1, 0, 1]]
+
+        return zafateni, list(range(1, len(zafateni))) + [pocetok]
+
+    def bitmapa(self, prepreka):
         """
-
-        :return: new object of type Prepreka
+        :param prepreka: polozhba na prepreka
+        :return: bitmapa od polinjata na mapata pod preprekata
         """
-        deltaX = self.deltaX
-        deltaY = self.deltaY
-
-        if self.preprekaX1 == self.prostorX1\
-            or self.preprekaX2 == self.prostorX2\
-            or self.preprekaX1 == self.prostorX2\
-            or self.preprekaX2 == self.prostorX1:
-                deltaX *= -1
-
-        if self.preprekaY1 == self.prostorY1 \
-            or self.preprekaY2 == self.prostorY2\
-            or self.preprekaY1 == self.prostorY2\
-            or self.preprekaY1 == self.prostorY1:
-            deltaY *= -1
-
-        return Prepreka(self.preprekaX1 + deltaX, self.preprekaY1 + deltaY,
-                        self.preprekaX2 + deltaX, self.preprekaY2 + deltaY,
-                        self.prostorX1, self.prostorY1, self.prostorX2, self.prostorY2,
-                        deltaX, deltaY)
-
-    def hitChoveche(self, choveche):
-        return (choveche[0] >= self.preprekaX1 and choveche[0] <= self.preprekaX2 and choveche[1] >= self.preprekaY1 and choveche[1] <= self.preprekaY2)
-
-    def __str__(self):
-        l = [self.preprekaX1, self.preprekaY1, self.preprekaX2, self.preprekaY2]
-        return str(l)
-
-    def __eq__(self, other):
-        return self.preprekaX1 == other.preprekaX1 and \
-               self.preprekaX2 == other.preprekaX2 and \
-               self.preprekaY1 == other.preprekaY2 and \
-               self.preprekaY2 == other.preprekaY2
+        bitmapa = 0
+        for redica, kolona in prepreka.polinja():
+            if 0 <= redica < self.redici and 0 <= kolona < self.koloni:
+                bitmapa |= 1 << (redica * self.koloni + kolona)
+        return bitmapa
 
+    def ciklusi(self, prepreki):
+        """
+        :param prepreki: lista od prepreki od opisot na mapata
+        :return: lista od (mu, niza) od ciklus za sekoja prepreka
+        """
+        return [self.ciklus(Prepreka(*(p['prepreka'] + p['prostor'] + p['delta']))) for p in prepreki]
 
-class PodvizniPrepreki(Problem):
-    # za prepreki chuvame goren lev agol
-    def __init__(self, choveche = (0, 0), kukja = (10, 10)):
-        prepreka1 = Prepreka(2, 2, 2, 3, 2, 0, 2, 5, 0, -1)
-        prepreka2 = Prepreka(7, 2, 8, 3, 5, 0, 10, 5, -1, 1)
-        prepreka3 = Prepreka(7, 8, 8, 8, 5, 8, 10, 8, 1, 0)
-        initial = (choveche, prepreka1, prepreka2, prepreka3, "")
-        super().__init__(initial, kukja)
+    @staticmethod
+    def ciklus(prepreka):
+        """
+        :param prepreka: pochetna polozhba na preprekata
+        :return: (mu, niza), kade niza se site razlichni polozhbi na preprekata
+                 po red, a od indeksot mu navamu tie se povtoruvaat ciklichno
+        """
+        niza = []
+        videni = {}
+        while True:
+            if prepreka in videni:
+                return videni[prepreka], niza
+            if prepreka.preprekaX1 < prepreka.prostorX1 or prepreka.preprekaX2 > prepreka.prostorX2 \
+                    or prepreka.preprekaY1 < prepreka.prostorY1 or prepreka.preprekaY2 > prepreka.prostorY2:
+                raise ValueError("preprekata izleguva od svojot prostor: %s" % prepreka)
+            videni[prepreka] = len(niza)
+            niza.append(prepreka)
+            prepreka = prepreka.move()
 
     def goal_test(self, state):
         g = self.goal
-        choveche = state[0]
-
-        return (g[0] == choveche[0] and g[1] == choveche[1])
 
-    def successor(self, state):
-        choveche = state[0]
-        prepreka1 = state[1]
-        prepreka2 = state[2]
-        prepreka3 = state[3]
+        return (g[0] == state[0] and g[1] == state[1])
 
+    def ispadaChoveche(self, choveche):
+        if (choveche[0] < 0 or choveche[0] >= self.redici):
+            return True
 
-        sucessors = {}
+        if (choveche[1] < 0 or choveche[1] >= self.koloni):
+            return True
 
-        prepreka1 = prepreka1.move()
-        prepreka2 = prepreka2.move()
-        prepreka3 = prepreka3.move()
+        return self.mapa[choveche[0]][choveche[1]] != '.'
 
-        # print(choveche)
+    def successor(self, state):
+        return {akcija: sledna for akcija, sledna, cena in self.transitions(state)}
+
+    def transitions(self, state):
+        redica, kolona, faza = state
+        faza = self.sledna_faza[faza]
+        blokirani = self.blokirani[faza]
+        if 0 <= redica < self.redici and 0 <= kolona < self.koloni:
+            sosedi = self.sosedi[redica * self.koloni + kolona]
+        else:
+            # samo pochetokot mozhe da e nadvor od mrezhata; indeksot vo
+            # self.sosedi bi pokazhal na drugo pole
+            sosedi = sosedi_na_pole(self.redici, self.koloni, redica, kolona)
+        return [(akcija, (red, kol, faza), 1)
+                for akcija, pole, red, kol in sosedi
+                if not blokirani >> pole & 1]
 
-        desnoChoveche = (choveche[0], choveche[1] + 1)
-        levoChoveche = (choveche[0], choveche[1] - 1)
-        goreChoveche = (choveche[0] - 1, choveche[1])
-        doleChoveche = (choveche[0] + 1, choveche[1])
+    def actions(self, state):
+        return self.successor(state).keys()
 
-        def ispadaChoveche(choveche):
-            if (choveche[0] < 0 or choveche[0] > 10):
-                return True
+    def result(self, state, action):
+        possible = self.successor(state)
+        return possible[action]
 
-            if (choveche[1] < 0 or choveche[1] > 10):
-                return True
+    def instance_key(self):
+        return 'PodvizniPrepreki:%d,%d:%d,%d:%s' % (self.initial[0], self.initial[1],
+                                                    self.goal[0], self.goal[1], self.mapa_hash)
+
+    def h(self, node):
+        # najkratko rastojanie do kukjata po statichkata mapa; preprekite
+        # mozhat samo da go prodolzhat patot, pa hevristikata e dopustliva
+        redica, kolona = node.state[0], node.state[1]
+        if 0 <= redica < self.redici and 0 <= kolona < self.koloni:
+            return self.rastojanie[redica * self.koloni + kolona]
+        return min([self.rastojanie[pole] for akcija, pole, red, kol
+                    in sosedi_na_pole(self.redici, self.koloni, redica, kolona)], default=float('inf')) + 1
+
+
+class RasporedPoPrepreki:
+    """Blokiranite polinja vo sekoja faza, kako zamena za listata od
+    bitmapi koga zaednichkiot period (NZS od periodite na preprekite) e
+    prevelik za da se chuva. Za sekoja prepreka se chuvaat samo bitmapite
+    na nejzinite polozhbi, a bitmapata za fazata t se dobiva so ILI od
+    polozhbite na indeksite t mod p_i (po predperiodot mu_i). Objektot se
+    indeksira kako listata blokirani, a sledna_faza kako listata na
+    slednite fazi. Poslednite KESH_FAZI presmetani bitmapi se chuvaat, za
+    da ne se presmetuvaat povtorno za sekoj jazol vo istata faza."""
+
+    def __init__(self, staticki, prepreki):
+        """
+        :param staticki: bitmapa od polinjata nadvor od mapata
+        :param prepreki: lista od (mu, bitmapi) za sekoja prepreka, kade
+                         bitmapi se polinjata pod nejzinite polozhbi po red,
+                         a od indeksot mu navamu tie se povtoruvaat ciklichno
+        """
+        self.staticki = staticki
+        self.prepreki = [(mu, bitmapi, len(bitmapi) - mu) for mu, bitmapi in prepreki]
+        self.pocetok = max([mu for mu, bitmapi in prepreki], default=0)
+        self.fazi = self.pocetok + math.lcm(*[period for mu, bitmapi, period in self.prepreki])
+        self.sledna_faza = SlednaFaza(self.pocetok, self.fazi)
+        self.kesh = OrderedDict()
+
+    def __getitem__(self, faza):
+        kesh = self.kesh
+        if faza in kesh:
+            kesh.move_to_end(faza)
+            return kesh[faza]
+        bitmapa = self.staticki
+        for mu, bitmapi, period in self.prepreki:
+            bitmapa |= bitmapi[faza if faza < mu else mu + (faza - mu) % period]
+        kesh[faza] = bitmapa
+        if len(kesh) > KESH_FAZI:
+            kesh.popitem(last=False)
+        return bitmapa
 
-            if choveche[0] >= 0 and choveche[0] <= 4:
-                if choveche[1] >= 0 and choveche[1] <= 5:
-                    return False
-                return True
+    def __len__(self):
+        return self.fazi
 
 
-        if (not ispadaChoveche(desnoChoveche) and not prepreka1.hitChoveche(desnoChoveche) and not prepreka2.hitChoveche(desnoChoveche) and not prepreka3.hitChoveche(desnoChoveche)) :
-            sucessors['Desno'] = (desnoChoveche, prepreka1, prepreka2, prepreka3, "Desno")
+class SlednaFaza:
+    """Slednata faza za RasporedPoPrepreki: faza + 1, a po poslednata faza
+    pocetokot na periodot."""
 
-        if (not ispadaChoveche(doleChoveche) and not prepreka1.hitChoveche(doleChoveche) and not prepreka2.hitChoveche(doleChoveche) and not prepreka3.hitChoveche(doleChoveche)) :
-            sucessors['Dolu'] = (doleChoveche, prepreka1, prepreka2, prepreka3, "Dolu")
+    def __init__(self, pocetok, fazi):
+        self.pocetok = pocetok
+        self.fazi = fazi
 
-        if (not ispadaChoveche(levoChoveche) and not prepreka1.hitChoveche(levoChoveche) and not prepreka2.hitChoveche(levoChoveche) and not prepreka3.hitChoveche(levoChoveche)) :
-            sucessors['Levo'] = (levoChoveche, prepreka1, prepreka2, prepreka3, "Levo")
+    def __getitem__(self, faza):
+        faza += 1
+        return faza if faza < self.fazi else self.pocetok
 
-        if (not ispadaChoveche(goreChoveche) and not prepreka1.hitChoveche(goreChoveche) and not prepreka2.hitChoveche(goreChoveche) and not prepreka3.hitChoveche(goreChoveche)):
-            sucessors['Gore'] = (goreChoveche, prepreka1, prepreka2, prepreka3, "Gore")
+    def __len__(self):
+        return self.fazi
 
 
-        return sucessors
+class TabelaPateki:
+    """Tabela so najkratkite rastojanija i prviot poteg od sekoja sostojba
+    (pole, faza) do dadena kukja, za edna mapa. Tabelata za edna kukja se
+    gradi so edno prebaruvanje vo shirina nanazad od kukjata, po shto
+    sekoe prashanje (choveche, kukja) se odgovara so odenje po tabelata,
+    vo vreme proporcionalno na dolzhinata na patot, bez prebaruvanje."""
 
+    # izgradenite tabeli, spored mapa_hash na mapata
+    tabeli = {}
 
-    def actions(self, state):
-        return self.successor(state).keys()
+    # oznaka za nedostizhna sostojba vo tabelata na rastojanija
+    NEDOSTIZHNO = 0xFFFF
 
-    def result(self, state, action):
-        possible = self.successor(state)
-        return possible[action]
+    def __init__(self, problem):
+        """
+        :param problem: PodvizniPrepreki nad mapata za koja se gradi tabelata
+        """
+        self.mapa_hash = problem.mapa_hash
+        self.redici = problem.redici
+        self.koloni = problem.koloni
+        self.blokirani = problem.blokirani
+        self.sledna_faza = problem.sledna_faza
+        self.sosedi = problem.sosedi
+        if isinstance(problem.blokirani, RasporedPoPrepreki):
+            raise ValueError("mapata ima %d fazi na preprekite (najmnogu %d za tabela)"
+                             % (problem.blokirani.fazi, MAX_FAZI))
+        self.fazi = len(problem.blokirani)
+        self.polinja = problem.redici * problem.koloni
+        self.rastojanija = {}
+        self.potezi = {}
+        self.vreme = 0.0
+
+        # fazite od koi se stignuva vo dadena faza, i za sekoe pole, od koi
+        # polinja se stignuva vo nego i koj e indeksot na potegot vo
+        # listata sosedi na tie polinja
+        self.prethodni_fazi = [[] for _ in range(0, self.fazi)]
+        for faza, sledna in enumerate(self.sledna_faza):
+            self.prethodni_fazi[sledna].append(faza)
+        self.prethodnici = [[] for _ in range(0, self.polinja)]
+        for pole, sosedi_pole in enumerate(self.sosedi):
+            for indeks, (akcija, sosed, red, kol) in enumerate(sosedi_pole):
+                self.prethodnici[sosed].append((pole, indeks))
+
+    @classmethod
+    def za_problem(cls, problem):
+        """
+        :param problem: PodvizniPrepreki
+        :return: zaednichkata TabelaPateki za mapata na problemot
+        """
+        tabela = cls.tabeli.get(problem.mapa_hash)
+        if tabela is None:
+            tabela = cls.tabeli[problem.mapa_hash] = cls(problem)
+        return tabela
 
+    def izgradi(self, kukja):
+        """Izgradi ja tabelata za kukjata kukja (ako vekje ne e izgradena).
 
-# Vcituvanje na vleznite argumenti za test primerite
+        :param kukja: (redica, kolona) na kukjata
+        :return: (rastojanija, potezi) indeksirani so pole * fazi + faza
+        """
+        cel = kukja[0] * self.koloni + kukja[1]
+        if cel in self.rastojanija:
+            return self.rastojanija[cel], self.potezi[cel]
+
+        start = time.perf_counter()
+        fazi = self.fazi
+        blokirani = self.blokirani
+        prethodni_fazi = self.prethodni_fazi
+        prethodnici = self.prethodnici
+        rastojanija = array('H', [self.NEDOSTIZHNO]) * (self.polinja * fazi)
+        potezi = bytearray(b'\xff') * (self.polinja * fazi)
+
+        # celta e dostignata vo bilo koja faza
+        neobraboteni = deque()
+        for faza in range(0, fazi):
+            rastojanija[cel * fazi + faza] = 0
+            neobraboteni.append((cel, faza))
+        while neobraboteni:
+            pole, faza = neobraboteni.popleft()
+            # vo poleto se vleguva samo ako e slobodno vo fazata po potegot
+            if blokirani[faza] >> pole & 1:
+                continue
+            rastojanie = rastojanija[pole * fazi + faza] + 1
+            for prethodna in prethodni_fazi[faza]:
+                for prethodno, indeks in prethodnici[pole]:
+                    sostojba = prethodno * fazi + prethodna
+                    if rastojanija[sostojba] == self.NEDOSTIZHNO:
+                        rastojanija[sostojba] = rastojanie
+                        potezi[sostojba] = indeks
+                        neobraboteni.append((prethodno, prethodna))
+
+        self.rastojanija[cel] = rastojanija
+        self.potezi[cel] = potezi
+        self.vreme += time.perf_counter() - start
+        return rastojanija, potezi
+
+    def izgradi_site(self):
+        """Izgradi gi tabelite za site polinja kako kukja."""
+        for pole in range(0, self.polinja):
+            self.izgradi(divmod(pole, self.koloni))
+
+    def rastojanie(self, choveche, kukja):
+        """
+        :return: dolzhinata na najkratkiot pat od choveche (vo faza 0) do
+                 kukja, ili None ako kukjata e nedostizhna
+        """
+        if not self.vnatre(choveche) or not self.vnatre(kukja):
+            pat = self.pateka(choveche, kukja)
+            return None if pat is None else len(pat)
+        rastojanija, potezi = self.izgradi(kukja)
+        rastojanie = rastojanija[(choveche[0] * self.koloni + choveche[1]) * self.fazi]
+        return None if rastojanie == self.NEDOSTIZHNO else rastojanie
+
+    def pateka(self, choveche, kukja):
+        """
+        :return: lista od (akcija, sostojba) po najkratkiot pat od choveche
+                 (vo faza 0) do kukja, ili None ako kukjata e nedostizhna
+        """
+        if (choveche[0], choveche[1]) == (kukja[0], kukja[1]):
+            return []
+        if not self.vnatre(kukja):
+            return None
+        rastojanija, potezi = self.izgradi(kukja)
+        pat = []
+        if self.vnatre(choveche):
+            pole, faza = choveche[0] * self.koloni + choveche[1], 0
+        else:
+            # pochetok nadvor od mrezhata: prviot poteg e kon najbliskiot
+            # sloboden sosed, a ponatamu se odi po tabelata
+            faza = self.sledna_faza[0]
+            potezi_nadvor = [(rastojanija[pole * self.fazi + faza], akcija, pole, red, kol)
+                             for akcija, pole, red, kol in sosedi_na_pole(self.redici, self.koloni, *choveche[:2])
+                             if not self.blokirani[faza] >> pole & 1]
+            if not potezi_nadvor:
+                return None
+            rastojanie, akcija, pole, red, kol = min(potezi_nadvor)
+            pat.append((akcija, (red, kol, faza)))
+        if rastojanija[pole * self.fazi + faza] == self.NEDOSTIZHNO:
+            return None
+        while rastojanija[pole * self.fazi + faza]:
+            akcija, pole, red, kol = self.sosedi[pole][potezi[pole * self.fazi + faza]]
+            faza = self.sledna_faza[faza]
+            pat.append((akcija, (red, kol, faza)))
+        return pat
+
+    def vnatre(self, pole):
+        """
+        :return: dali poleto (redica, kolona) e vo mrezhata
+        """
+        return 0 <= pole[0] < self.redici and 0 <= pole[1] < self.koloni
 
-choveche_redica = int(input())
-choveche_kolona = int(input())
-kukja_redica = int(input())
-kukja_kolona = int(input())
+    def memorija(self):
+        """
+        :return: kolku bajti zafakjaat izgradenite tabeli
+        """
+        return sum(len(rastojanija) * rastojanija.itemsize + len(self.potezi[cel])
+                   for cel, rastojanija in self.rastojanija.items())
+
+    def zachuvaj(self, pateka):
+        """Zachuvaj gi izgradenite tabeli vo datotekata pateka."""
+        with open(pateka, 'wb') as datoteka:
+            pickle.dump({'mapa_hash': self.mapa_hash, 'fazi': self.fazi,
+                         'rastojanija': {cel: rastojanija.tobytes()
+                                         for cel, rastojanija in self.rastojanija.items()},
+                         'potezi': {cel: bytes(potezi) for cel, potezi in self.potezi.items()}},
+                        datoteka, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def vcitaj(self, pateka):
+        """Vcitaj gi tabelite zachuvani so zachuvaj. Datotekata mora da e
+        zachuvana za istata mapa.
+
+        :param pateka: pateka do datotekata
+        """
+        with open(pateka, 'rb') as datoteka:
+            podatoci = pickle.load(datoteka)
+        if podatoci['mapa_hash'] != self.mapa_hash or podatoci['fazi'] != self.fazi:
+            raise ValueError("tabelite vo %s se za druga mapa" % pateka)
+        for cel, rastojanija in podatoci['rastojanija'].items():
+            self.rastojanija[cel] = array('H')
+            self.rastojanija[cel].frombytes(rastojanija)
+            self.potezi[cel] = bytearray(podatoci['potezi'][cel])
+
+
+def tabela_search(problem):
+    """Reshi go problemot PodvizniPrepreki so odenje po TabelaPateki za
+    negovata mapa, bez prebaruvanje. Vrakja jazel chij pat e najkratok,
+    kako i breadth_first_graph_search.
+
+    :param problem: daden problem od tip PodvizniPrepreki
+    :return: Node
+    """
+    pat = TabelaPateki.za_problem(problem).pateka(problem.initial, problem.goal)
+    if pat is None:
+        return None
+    node = Node(problem.initial)
+    for akcija, sostojba in pat:
+        node = node.child_node(problem, akcija, sostojba, 1)
+    return node
 
-reprezentacija = PodvizniPrepreki((choveche_redica, choveche_kolona), (kukja_redica, kukja_kolona))
 
+def benchmark_expansions(povtoruvanja=20):
+    """Izmeri kolku ekspanzii vo sekunda pravi PodvizniPrepreki.transitions
+    nad site sostojbi (redica, kolona, faza) vo mapata, kako i vremeto na
+    breadth_first_graph_search za site parovi pochetok/cel.
 
-print(breadth_first_graph_search(reprezentacija).solution())
-# answer = breadth_first_graph_search(reprezentacija).solve()
-#
-# answerList = []
-#
-# for step in answer:
-#     if step[4] != "":
-#         answerList += [step[4]]
-#
-# print(answerList)
+    :param povtoruvanja: kolku pati se pominuvaat site sostojbi
+    """
+    problem = PodvizniPrepreki()
+    sostojbi = [(redica, kolona, faza)
+                for redica in range(0, problem.redici) for kolona in range(0, problem.koloni)
+                if not problem.ispadaChoveche((redica, kolona))
+                for faza in range(0, len(problem.blokirani))]
+    start = time.perf_counter()
+    for _ in range(0, povtoruvanja):
+        for sostojba in sostojbi:
+            list(problem.transitions(sostojba))
+    elapsed = time.perf_counter() - start
+    print("transitions:  %10.0f expansions/s" % (povtoruvanja * len(sostojbi) / elapsed))
+
+    polinja = sorted({(redica, kolona) for redica, kolona, faza in sostojbi})
+    start = time.perf_counter()
+    for choveche in polinja:
+        for kukja in polinja:
+            breadth_first_graph_search(PodvizniPrepreki(choveche, kukja))
+    elapsed = time.perf_counter() - start
+    print("BFS:          %10.3f s for %d start/goal pairs" % (elapsed, len(polinja) ** 2))
+
+    tabela = TabelaPateki(problem)
+    tabela.izgradi_site()
+    print("table build:  %10.3f s, %d bytes" % (tabela.vreme, tabela.memorija()))
+    start = time.perf_counter()
+    for choveche in polinja:
+        for kukja in polinja:
+            tabela.pateka(choveche, kukja)
+    elapsed = time.perf_counter() - start
+    print("table query:  %10.3f s for %d start/goal pairs" % (elapsed, len(polinja) ** 2))
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        benchmark_expansions()
+        return
+
+    # Vcituvanje na vleznite argumenti za test primerite
+
+    choveche_redica = int(input())
+    choveche_kolona = int(input())
+    kukja_redica = int(input())
+    kukja_kolona = int(input())
+
+    reprezentacija = PodvizniPrepreki((choveche_redica, choveche_kolona), (kukja_redica, kukja_kolona))
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'table':
+        # python PodvizhniPrepreki.py table [datoteka]: tabelite se vchituvaat
+        # od datotekata ako postoi, inaku se gradat i se zachuvuvaat vo nea
+        tabela = TabelaPateki.za_problem(reprezentacija)
+        if len(sys.argv) > 2:
+            try:
+                tabela.vcitaj(sys.argv[2])
+            except FileNotFoundError:
+                tabela.izgradi_site()
+                tabela.zachuvaj(sys.argv[2])
+        print(tabela_search(reprezentacija).solution())
+        print("table build: %.3f s, %d bytes" % (tabela.vreme, tabela.memorija()), file=sys.stderr)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'compare':
+        compare_searchers(reprezentacija, [breadth_first_graph_search, uniform_cost_search,
+                                           astar_search, weighted_astar_search,
+                                           greedy_best_first_graph_search])
+    else:
+        print(breadth_first_graph_search(reprezentacija).solution())
+
+
+if __name__ == '__main__':
+    main()
 
 # testiranje na prepreka1
 #     prepreka1 = Prepreka(2, 2, 2, 3, 2, 0, 2, 5, 0, -1)
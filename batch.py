@@ -0,0 +1,227 @@
+"""
+Групно решавање на многу примероци од CrnoBelo и PodvizniPrepreki.
+
+Примероците се читаат како JSON редови од датотека или од стандардниот
+влез, се делат меѓу процесите на multiprocessing.Pool во парчиња
+(chunksize) за да се намали трошокот за комуникација, а резултатите се
+запишуваат веднаш штом се готови, исто така како JSON редови.
+
+Формат на примерок (полињата id и engine се опционални):
+
+    {"id": 1, "problem": "CrnoBelo", "n": 3, "polinja": [1, 0, 0, 1, 1, 1, 0, 1, 0], "engine": "gf2"}
+    {"id": 2, "problem": "PodvizniPrepreki", "choveche": [0, 0], "kukja": [10, 10], "engine": "astar"}
+
+Примерокот за CrnoBelo може да има и поле "symmetric" (види CrnoBelo),
+а примерокот за PodvizniPrepreki поле "mapa" во форматот на ucitaj_mapa.
+Секој излезен ред ги содржи id, status (ok, suboptimal, unsolvable,
+timeout или error), solution, length, time (секунди), expanded,
+generated, goal_tests и cached. Статусот suboptimal значи дека
+решението е точно, но не е загарантирано најкратко (gf2 на табла со
+преголем нулти простор, види gf2_solve); таквите решенија не се кешираат.
+
+Употреба:
+
+    python batch.py [-j PROCESI] [-c CHUNKSIZE] [-t TIMEOUT] [--cache BAZA] [--cache-size N]
+                    [--cache-disk-size N] [-o IZLEZ] [VLEZ]
+"""
+
+import argparse
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import signal
+import sys
+import time
+
+from searching_framework import (InstrumentedProblem, breadth_first_graph_search, uniform_cost_search,
+                                 astar_search, weighted_astar_search, greedy_best_first_graph_search,
+                                 iterative_deepening_search, ida_star_search)
+from CrnoBelo import CrnoBelo, ENGINES, NotMinimalError
+from PodvizhniPrepreki import PodvizniPrepreki, tabela_search
+from solution_cache import SolutionCache
+
+
+SEARCHERS = {'bfs': breadth_first_graph_search, 'ucs': uniform_cost_search, 'astar': astar_search,
+             'wastar': weighted_astar_search, 'greedy': greedy_best_first_graph_search,
+             'ids': iterative_deepening_search, 'ida': ida_star_search}
+
+# parallel не е тука: процесите на Pool се демонски и не може да стартуваат
+# свои процеси, а паралелноста ја дава самиот batch
+CRNOBELO_SEARCHERS = dict(SEARCHERS, **{name: engine for name, engine in ENGINES.items() if name != 'parallel'})
+
+PROBLEMS = {
+    'CrnoBelo': (lambda instance: CrnoBelo(instance['n'], instance['polinja'], bitboard=True,
+                                           symmetric=instance.get('symmetric', False)),
+                 CRNOBELO_SEARCHERS, 'gf2'),
+    'PodvizniPrepreki': (lambda instance: PodvizniPrepreki(tuple(instance['choveche']), tuple(instance['kukja']),
+                                                           instance.get('mapa')),
+                         dict(SEARCHERS, table=tabela_search), 'bfs'),
+}
+
+
+class Timeout(Exception):
+    """Примерокот не е решен во дадената граница на време."""
+
+
+def _alarm(signum, frame):
+    raise Timeout()
+
+
+def _init_worker(timeout, cache_path=None, cache_size=0, cache_disk_size=None):
+    """Иницијализација на секој процес: SIGINT го обработува главниот
+    процес, а SIGALRM го прекинува пребарувањето кое трае предолго.
+    Кешот се затвора при излегувањето од процесот, за да се запишат и
+    времињата на користење од процесите кои само читале од базата."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _init_state(timeout, cache_path, cache_size, cache_disk_size)
+    if _cache is not None:
+        multiprocessing.util.Finalize(None, _cache.close, exitpriority=10)
+
+
+def _init_state(timeout, cache_path=None, cache_size=0, cache_disk_size=None):
+    global _timeout, _cache
+    _timeout = timeout
+    if timeout:
+        signal.signal(signal.SIGALRM, _alarm)
+    _cache = SolutionCache(cache_size, cache_path, cache_disk_size) if cache_path or cache_size else None
+
+
+_timeout = None
+_cache = None
+
+
+def solve_instance(instance):
+    """Реши еден примерок и врати речник со резултатот, времето на
+    решавање и бројот на експандирани и генерирани јазли. Ако е вклучен
+    кешот, решението се зема од него кога е можно (cached е True, а
+    бројачите на јазли се 0).
+
+    :param instance: речник во форматот опишан погоре
+    :return: dict
+    """
+    result = {'id': instance.get('id'), 'status': 'error', 'solution': None, 'length': None,
+              'time': None, 'expanded': None, 'generated': None, 'goal_tests': None, 'cached': False}
+    start = time.perf_counter()
+    p = None
+    try:
+        make, searchers, default = PROBLEMS[instance['problem']]
+        searcher = searchers[instance.get('engine', default)]
+        if _timeout:
+            signal.setitimer(signal.ITIMER_REAL, _timeout)
+        try:
+            p = InstrumentedProblem(make(instance))
+            key = _cache.key(p, searcher) if _cache is not None else None
+            found, solution = _cache.get(key) if key is not None else (False, None)
+            minimal = True
+            if not found:
+                try:
+                    node = searcher(p)
+                except NotMinimalError as e:
+                    node, minimal = e.node, False
+                solution = node.solution() if node is not None else None
+        finally:
+            if _timeout:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        if key is not None and not found and minimal:
+            _cache.put(key, solution)
+        result['cached'] = found
+        if solution is None:
+            result['status'] = 'unsolvable'
+        else:
+            result['status'] = 'ok' if minimal else 'suboptimal'
+            result['solution'] = solution
+            result['length'] = len(solution)
+    except Timeout:
+        result['status'] = 'timeout'
+    except Exception as e:
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+    result['time'] = time.perf_counter() - start
+    if p is not None:
+        result['expanded'], result['generated'], result['goal_tests'] = p.succs, p.states, p.goal_tests
+    return result
+
+
+def read_instances(lines):
+    """Генератор на примероци од JSON редови. Празните редови се
+    прескокнуваат, а примероците без id добиваат реден број."""
+    for number, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        instance = json.loads(line)
+        instance.setdefault('id', number)
+        yield instance
+
+
+def solve_batch(instances, processes=None, chunksize=16, timeout=None, ordered=False,
+                cache_path=None, cache_size=0, cache_disk_size=None):
+    """Генератор на резултати за примероците instances. Со processes=1
+    сè се решава во тековниот процес, инаку се користи Pool.
+
+    :param instances: итерабилна колекција од примероци
+    :param processes: број на процеси (подразбирливо бројот на јадра)
+    :param chunksize: колку примероци се праќаат на процес наеднаш
+    :param timeout: граница на време по примерок во секунди
+    :param ordered: дали резултатите се враќаат по редоследот на влезот
+    :param cache_path: патека до sqlite базата на SolutionCache
+    :param cache_size: големина на кешот во меморија на секој процес
+    :param cache_disk_size: најмногу записи во базата (None значи без граница)
+    :return: генератор од речници
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        _init_state(timeout, cache_path, cache_size, cache_disk_size)
+        try:
+            for instance in instances:
+                yield solve_instance(instance)
+        finally:
+            if _cache is not None:
+                _cache.close()
+        return
+
+    pool = multiprocessing.Pool(processes, _init_worker, (timeout, cache_path, cache_size, cache_disk_size))
+    try:
+        imap = pool.imap if ordered else pool.imap_unordered
+        for result in imap(solve_instance, instances, chunksize):
+            yield result
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        # процесите завршуваат нормално, за да се извршат нивните Finalize
+        pool.close()
+    finally:
+        pool.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Групно решавање на примероци од JSON редови.')
+    parser.add_argument('input', nargs='?', help='влезна датотека (подразбирливо стандарден влез)')
+    parser.add_argument('-o', '--output', help='излезна датотека (подразбирливо стандарден излез)')
+    parser.add_argument('-j', '--processes', type=int, default=None, help='број на процеси')
+    parser.add_argument('-c', '--chunksize', type=int, default=16, help='примероци по порака до процес')
+    parser.add_argument('-t', '--timeout', type=float, default=None, help='секунди по примерок')
+    parser.add_argument('--cache', help='sqlite база за кеширање на решенијата')
+    parser.add_argument('--cache-size', type=int, default=1024, help='записи во кешот во меморија')
+    parser.add_argument('--cache-disk-size', type=int, default=None, help='најмногу записи во базата')
+    parser.add_argument('--ordered', action='store_true', help='задржи го редоследот на влезот')
+    args = parser.parse_args()
+
+    source = open(args.input) if args.input else sys.stdin
+    sink = open(args.output, 'w') if args.output else sys.stdout
+    try:
+        for result in solve_batch(read_instances(source), args.processes, args.chunksize,
+                                  args.timeout, args.ordered, args.cache, args.cache_size,
+                                  args.cache_disk_size):
+            sink.write(json.dumps(result) + '\n')
+            sink.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+
+if __name__ == '__main__':
+    main()
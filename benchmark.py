@@ -0,0 +1,259 @@
+"""
+Репродуцибилни мерења на перформансите на CrnoBelo и PodvizniPrepreki.
+
+Товарите се генерираат со дадено seed: решливи табли CrnoBelo за n од 2
+до 8 (случајни притисоци врз полната табла) и парови почеток/цел од
+слободните полиња на PodvizniPrepreki (сите парови или случаен примерок).
+Секое пребарување се извршува повеќе пати над целиот товар, а за секоја
+комбинација се запишуваат медијана и 95-ти перцентил на времето по
+примерок и по повторување, бројот на експандирани јазли и најголемата
+меморија. Резултатите се зачувуваат како JSON, а два зачувани резултати
+може да се споредат.
+
+Употреба:
+
+    python benchmark.py run [-o REZULTATI.json] [-r POVTORUVANJA] [-s SEED] [--boards N]
+                            [--pairs N | --exhaustive] [--only CrnoBelo|PodvizniPrepreki]
+    python benchmark.py compare STARI.json NOVI.json [--threshold 0.1]
+"""
+
+import argparse
+import functools
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from searching_framework import (InstrumentedProblem, breadth_first_graph_search,
+                                 bidirectional_breadth_first_search, uniform_cost_search,
+                                 astar_search, weighted_astar_search, greedy_best_first_graph_search,
+                                 ida_star_search)
+from CrnoBelo import CrnoBelo, gf2_search, chase_lights_search, random_board
+from PodvizhniPrepreki import PodvizniPrepreki, TabelaPateki, tabela_search
+
+
+# пребарувањата за CrnoBelo и најголемото n за кое се мерат, бидејќи
+# просторот на состојби е 2^(n*n)
+CRNOBELO_SEARCHERS = {
+    'bfs': (breadth_first_graph_search, 4),
+    'bidir': (bidirectional_breadth_first_search, 5),
+    'ucs': (uniform_cost_search, 4),
+    'astar': (astar_search, 4),
+    'wastar': (weighted_astar_search, 4),
+    'greedy': (greedy_best_first_graph_search, 4),
+    'ida': (ida_star_search, 4),
+    'chase': (chase_lights_search, 8),
+    'gf2': (gf2_search, 8),
+}
+
+# пребарувањата за PodvizniPrepreki; IDA* е со транспозициска табела,
+# за да заврши и кога до целта не може да се стигне
+PODVIZNI_SEARCHERS = {
+    'bfs': breadth_first_graph_search,
+    'ucs': uniform_cost_search,
+    'astar': astar_search,
+    'wastar': weighted_astar_search,
+    'greedy': greedy_best_first_graph_search,
+    'ida': functools.partial(ida_star_search, table_size=1 << 16),
+    'table': tabela_search,
+}
+
+
+def crnobelo_boards(n, boards, seed):
+    """Врати boards решливи табли со големина n, со n*n/3 (барем еден)
+    случајни притисоци врз полната табла.
+
+    :param n: големина на таблата
+    :param boards: број на табли
+    :param seed: seed за генерирање
+    :return: листа од табли (листи од n*n нули и единици)
+    """
+    rng = random.Random('%s:%d' % (seed, n))
+    return [random_board(n, max(1, n * n // 3), rng) for _ in range(0, boards)]
+
+
+def podvizni_pairs(pairs=None, seed=0, mapa=None):
+    """Врати парови (почеток, цел) од слободните полиња на мапата: сите
+    парови ако pairs е None, инаку pairs случајни парови.
+
+    :param pairs: број на парови или None за сите
+    :param seed: seed за генерирање
+    :param mapa: опис на мапата (види ucitaj_mapa)
+    :return: листа од парови ((редица, колона), (редица, колона))
+    """
+    problem = PodvizniPrepreki(mapa=mapa)
+    polinja = [(redica, kolona) for redica in range(0, problem.redici) for kolona in range(0, problem.koloni)
+               if not problem.ispadaChoveche((redica, kolona))]
+    if pairs is None:
+        return [(choveche, kukja) for choveche in polinja for kukja in polinja]
+    rng = random.Random(seed)
+    return [(rng.choice(polinja), rng.choice(polinja)) for _ in range(0, pairs)]
+
+
+def percentile(values, p):
+    """p-ти перцентил по методот на најблискиот ранг."""
+    values = sorted(values)
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def measure(problems, searcher, repeat, reset=None):
+    """Измери го searcher над сите проблеми во problems.
+
+    Прво се извршува едно поминување со InstrumentedProblem и
+    tracemalloc, за бројот на експандирани јазли и најголемата меморија,
+    а потоа repeat поминувања без обвивки за времето.
+
+    :param problems: листа од проблеми
+    :param searcher: функција за пребарување
+    :param repeat: број на повторувања за времето
+    :param reset: функција која се повикува пред секое поминување (на
+                  пример за бришење на кешовите)
+    :return: речник со резултатите
+    """
+    if reset is not None:
+        reset()
+    expanded = generated = solved = 0
+    peak = 0
+    tracemalloc.start()
+    for problem in problems:
+        tracemalloc.reset_peak()
+        p = InstrumentedProblem(problem)
+        node = searcher(p)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        expanded += p.succs
+        generated += p.states
+        solved += node is not None
+    tracemalloc.stop()
+
+    times = []
+    totals = []
+    for _ in range(0, repeat):
+        if reset is not None:
+            reset()
+        total = 0.0
+        for problem in problems:
+            start = time.perf_counter()
+            searcher(problem)
+            elapsed = time.perf_counter() - start
+            times.append(elapsed)
+            total += elapsed
+        totals.append(total)
+
+    return {'instances': len(problems), 'solved': solved, 'repeat': repeat,
+            'median': statistics.median(times), 'p95': percentile(times, 95),
+            'total_median': statistics.median(totals), 'total_p95': percentile(totals, 95),
+            'expanded': expanded, 'generated': generated, 'peak_memory': peak}
+
+
+def run(repeat=5, seed=0, boards=5, pairs=50, only=None, sizes=range(2, 9), out=sys.stdout):
+    """Изврши ги сите мерења и врати ги резултатите како речник.
+
+    :param repeat: број на повторувања за времето
+    :param seed: seed за генерирање на товарите
+    :param boards: број на табли CrnoBelo по големина
+    :param pairs: број на случајни парови PodvizniPrepreki, None за сите
+    :param only: 'CrnoBelo' или 'PodvizniPrepreki' за само едниот проблем
+    :param sizes: големини на таблите CrnoBelo
+    :param out: каде се печати напредокот (None за без печатење)
+    :return: речник со мета податоци и резултати
+    """
+    results = {}
+
+    def report(name, result):
+        results[name] = result
+        if out is not None:
+            print('%-30s median %9.6f s  p95 %9.6f s  total %8.4f s  expanded %9d  peak %9d B'
+                  % (name, result['median'], result['p95'], result['total_median'],
+                     result['expanded'], result['peak_memory']), file=out, flush=True)
+
+    if only in (None, 'CrnoBelo'):
+        for n in sizes:
+            problems = [CrnoBelo(n, board, bitboard=True) for board in crnobelo_boards(n, boards, seed)]
+            for name, (searcher, max_n) in CRNOBELO_SEARCHERS.items():
+                if n <= max_n:
+                    report('CrnoBelo/n=%d/%s' % (n, name), measure(problems, searcher, repeat))
+
+    if only in (None, 'PodvizniPrepreki'):
+        problems = [PodvizniPrepreki(choveche, kukja) for choveche, kukja in podvizni_pairs(pairs, seed)]
+        for name, searcher in PODVIZNI_SEARCHERS.items():
+            # табелите се градат одново во секое поминување, за времето
+            # да го вклучи и нивното градење
+            reset = TabelaPateki.tabeli.clear if searcher is tabela_search else None
+            report('PodvizniPrepreki/%s' % name, measure(problems, searcher, repeat, reset))
+
+    return {'meta': {'python': platform.python_version(), 'platform': platform.platform(),
+                     'seed': seed, 'repeat': repeat, 'boards': boards, 'pairs': pairs,
+                     'date': time.strftime('%Y-%m-%dT%H:%M:%S')},
+            'results': results}
+
+
+def compare(old, new, threshold=0.1, out=sys.stdout):
+    """Спореди два резултати од run и означи ги регресиите: медијаната
+    на вкупното време или најголемата меморија се зголемила за повеќе од
+    threshold (релативно), или бројот на експандирани јазли се зголемил.
+
+    :param old: постари резултати
+    :param new: нови резултати
+    :param threshold: дозволено релативно зголемување
+    :param out: каде се печати споредбата
+    :return: листа од имињата на мерењата со регресија
+    """
+    regressions = []
+    for name in sorted(set(old['results']) & set(new['results'])):
+        a, b = old['results'][name], new['results'][name]
+        flags = []
+        ratio = b['total_median'] / a['total_median'] if a['total_median'] else 1.0
+        if ratio > 1 + threshold:
+            flags.append('time')
+        if b['expanded'] > a['expanded']:
+            flags.append('expanded')
+        if a['peak_memory'] and b['peak_memory'] / a['peak_memory'] > 1 + threshold:
+            flags.append('memory')
+        if flags:
+            regressions.append(name)
+        print('%-30s time %9.4f -> %9.4f s (%5.2fx)  expanded %9d -> %9d  peak %9d -> %9d B  %s'
+              % (name, a['total_median'], b['total_median'], ratio, a['expanded'], b['expanded'],
+                 a['peak_memory'], b['peak_memory'], 'REGRESSION: ' + ', '.join(flags) if flags else ''),
+              file=out)
+    for name in sorted(set(old['results']) ^ set(new['results'])):
+        print('%-30s only in %s' % (name, 'old' if name in old['results'] else 'new'), file=out)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Мерења на перформансите на CrnoBelo и PodvizniPrepreki.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='изврши ги мерењата')
+    run_parser.add_argument('-o', '--output', help='JSON датотека за резултатите')
+    run_parser.add_argument('-r', '--repeat', type=int, default=5, help='број на повторувања')
+    run_parser.add_argument('-s', '--seed', type=int, default=0, help='seed за товарите')
+    run_parser.add_argument('--boards', type=int, default=5, help='табли CrnoBelo по големина')
+    run_parser.add_argument('--pairs', type=int, default=50, help='случајни парови PodvizniPrepreki')
+    run_parser.add_argument('--exhaustive', action='store_true', help='сите парови PodvizniPrepreki')
+    run_parser.add_argument('--only', choices=('CrnoBelo', 'PodvizniPrepreki'), help='само еден проблем')
+    compare_parser = commands.add_parser('compare', help='спореди два резултати')
+    compare_parser.add_argument('old', help='постари резултати')
+    compare_parser.add_argument('new', help='нови резултати')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='дозволено релативно зголемување')
+    args = parser.parse_args()
+
+    if args.command == 'run':
+        results = run(args.repeat, args.seed, args.boards, None if args.exhaustive else args.pairs, args.only)
+        if args.output:
+            with open(args.output, 'w') as datoteka:
+                json.dump(results, datoteka, indent=1)
+    else:
+        with open(args.old) as datoteka:
+            old = json.load(datoteka)
+        with open(args.new) as datoteka:
+            new = json.load(datoteka)
+        if compare(old, new, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Заеднички помошни функции за регресиските тестови (test_*.py): табли
+CrnoBelo и парови PodvizniPrepreki генерирани со фиксно seed, и
+EngineTestCase.assertSameAsBFS, кој пребарувањето го споредува со
+breadth_first_graph_search. Се проверува дека се согласуваат за
+решливоста и должината на решението и дека решението, применето со
+result од почетната состојба, стига до целта.
+
+    python -m pytest -q
+"""
+
+import random
+import unittest
+
+from searching_framework import breadth_first_graph_search
+from CrnoBelo import CrnoBelo, random_board
+from PodvizhniPrepreki import PodvizniPrepreki
+
+
+def crnobelo_boards(seed=0):
+    """Случајни табли за n од 2 до 4: решливи (случајни притисоци) и
+    произволни; за n=4 системот е сингуларен, па меѓу нив има и нерешливи."""
+    rng = random.Random(seed)
+    boards = []
+    for n, count in ((2, 6), (3, 6), (4, 3)):
+        for _ in range(0, count):
+            boards.append((n, random_board(n, rng.randrange(1, n * n), rng)))
+        for _ in range(0, count // 2 if n < 4 else 2):
+            boards.append((n, [rng.randrange(2) for _ in range(0, n * n)]))
+    return boards
+
+
+def crnobelo_problems(symmetric=False):
+    """Парови (проблем за пребарувањето, проблем за проверка) за
+    crnobelo_boards."""
+    return [(CrnoBelo(n, board, bitboard=True, symmetric=symmetric), CrnoBelo(n, board, bitboard=True))
+            for n, board in crnobelo_boards()]
+
+
+def podvizhni_pairs(count=40, seed=0):
+    """Случајни парови од слободните полиња на основната мапа."""
+    problem = PodvizniPrepreki()
+    polinja = [(redica, kolona) for redica in range(0, problem.redici) for kolona in range(0, problem.koloni)
+               if not problem.ispadaChoveche((redica, kolona))]
+    rng = random.Random(seed)
+    return [(rng.choice(polinja), rng.choice(polinja)) for _ in range(0, count)]
+
+
+def podvizhni_problems(pairs=None):
+    """Парови (проблем за пребарувањето, проблем за проверка) за pairs
+    (подразбирливо podvizhni_pairs())."""
+    return [(PodvizniPrepreki(choveche, kukja), PodvizniPrepreki(choveche, kukja))
+            for choveche, kukja in pairs or podvizhni_pairs()]
+
+
+class EngineTestCase(unittest.TestCase):
+
+    def assertSameAsBFS(self, make, searcher, solvable_only=False):
+        """Спореди го searcher со breadth_first_graph_search на проблемите
+        кои ги враќа make (листа од парови (проблем за пребарувањето,
+        проблем за проверка на решението))."""
+        for problem, plain in make():
+            expected = breadth_first_graph_search(plain)
+            if solvable_only and expected is None:
+                continue
+            with self.subTest(initial=plain.initial, goal=plain.goal):
+                node = searcher(problem)
+                self.assertEqual(node is None, expected is None)
+                if node is None:
+                    continue
+                solution = node.solution()
+                self.assertEqual(len(solution), len(expected.solution()))
+                state = plain.initial
+                for action in solution:
+                    state = plain.result(state, action)
+                self.assertTrue(plain.goal_test(state))
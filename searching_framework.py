@@ -0,0 +1,1603 @@
+"""
+Заедничка рамка за пребарување која ја користат проблемите CrnoBelo и
+PodvizniPrepreki: класите Problem и Node, редиците и сите функции за
+пребарување.
+"""
+
+import functools
+import heapq
+import itertools
+import multiprocessing
+import os
+import queue
+import tempfile
+import time
+import traceback
+from array import array
+from collections import OrderedDict, deque
+
+
+"""
+Дефинирање на класа за структурата на проблемот кој ќе го решаваме со пребарување.
+Класата Problem е апстрактна класа од која правиме наследување за дефинирање на основните 
+карактеристики на секој проблем што сакаме да го решиме
+"""
+
+
+class Problem:
+    def __init__(self, initial, goal=None):
+        self.initial = initial
+        self.goal = goal
+
+    def successor(self, state):
+        """За дадена состојба, врати речник од парови {акција : состојба}
+        достапни од оваа состојба. Ако има многу следбеници, употребете
+        итератор кој би ги генерирал следбениците еден по еден, наместо да
+        ги генерирате сите одеднаш.
+
+        :param state: дадена состојба
+        :return:  речник од парови {акција : состојба} достапни од оваа
+                  состојба
+        :rtype: dict
+        """
+        raise NotImplementedError
+
+    def actions(self, state):
+        """За дадена состојба state, врати листа од сите акции што може да
+        се применат над таа состојба
+
+        :param state: дадена состојба
+        :return: листа на акции
+        :rtype: list
+        """
+        return self.successor(state).keys()
+
+    def result(self, state, action):
+        """За дадена состојба state и акција action, врати ја состојбата
+        што се добива со примена на акцијата над состојбата
+
+        :param state: дадена состојба
+        :param action: дадена акција
+        :return: резултантна состојба
+        """
+        possible = self.successor(state)
+        return possible[action]
+
+    def transitions(self, state):
+        """За дадена состојба state, врати ги во едно поминување сите тројки
+        (акција, следбеник, цена на чекорот) достапни од неа. Даденава
+        имплементација ја повикува successor само еднаш; ако проблемот не ја
+        дефинира successor, се користат actions и result.
+
+        :param state: дадена состојба
+        :return: тројки (акција, состојба, цена на чекорот)
+        :rtype: iterable
+        """
+        if type(self).successor is Problem.successor:
+            for action in self.actions(state):
+                next_state = self.result(state, action)
+                yield action, next_state, self.path_cost(0, state, action, next_state)
+        else:
+            for action, next_state in self.successor(state).items():
+                yield action, next_state, self.path_cost(0, state, action, next_state)
+
+    def reverse_transitions(self, state):
+        """За дадена состојба state, врати ги тројките (акција, претходник,
+        цена на чекорот) такви што акцијата применета над претходникот
+        води во state. Ја користи пребарувањето од двете страни; проблемот
+        треба да го дефинира овој метод и целната состојба self.goal.
+
+        :param state: дадена состојба
+        :return: тројки (акција, состојба, цена на чекорот)
+        :rtype: iterable
+        """
+        raise NotImplementedError
+
+    def goal_test(self, state):
+        """Врати True ако state е целна состојба. Даденава имплементација
+        на методот директно ја споредува state со self.goal, како што е
+        специфицирана во конструкторот. Имплементирајте го овој метод ако
+        проверката со една целна состојба self.goal не е доволна.
+
+        :param state: дадена состојба
+        :return: дали дадената состојба е целна состојба
+        :rtype: bool
+        """
+        return state == self.goal
+
+    def path_cost(self, c, state1, action, state2):
+        """Врати ја цената на решавачкиот пат кој пристигнува во состојбата
+        state2 од состојбата state1 преку акцијата action, претпоставувајќи
+        дека цената на патот до состојбата state1 е c. Ако проблемот е таков
+        што патот не е важен, оваа функција ќе ја разгледува само состојбата
+        state2. Ако патот е важен, ќе ја разгледува цената c и можеби и
+        state1 и action. Даденава имплементација му доделува цена 1 на секој
+        чекор од патот.
+
+        :param c: цена на патот до состојбата state1
+        :param state1: дадена моментална состојба
+        :param action: акција која треба да се изврши
+        :param state2: состојба во која треба да се стигне
+        :return: цена на патот по извршување на акцијата
+        :rtype: float
+        """
+        return c + 1
+
+    def value(self):
+        """За проблеми на оптимизација, секоја состојба си има вредност. 
+        Hill-climbing и сличните алгоритми се обидуваат да ја максимизираат
+        оваа вредност.
+
+        :return: вредност на состојба
+        :rtype: float
+        """
+        raise NotImplementedError
+
+    def state_key(self, state):
+        """Врати компактен hashable клуч за состојбата state. Две состојби
+        со ист клуч се сметаат за иста состојба во затворената листа и во
+        редиците кај пребарувањето. Даденава имплементација ја враќа самата
+        состојба; препокријте го методот ако состојбата не е hashable или
+        ако постои поевтин канонски клуч.
+
+        :param state: дадена состојба
+        :return: клуч на состојбата
+        """
+        return state
+
+    def instance_key(self):
+        """Врати канонски клуч за целиот примерок (почетна состојба, цел
+        и сè друго од што зависи решението), како стринг. Два примерока
+        со ист клуч имаат исти решенија, па клучот се користи за кеширање
+        на решенијата. Даденава имплементација враќа None, т.е. проблемот
+        не се кешира.
+
+        :return: клуч на примерокот или None
+        :rtype: str
+        """
+        return None
+
+    def key_state(self, key):
+        """Инверз на state_key: врати ја состојбата со клуч key. Го користат
+        пребарувањата кои чуваат само клучеви на состојбите, на пример
+        external_breadth_first_search. Даденава имплементација го враќа
+        самиот клуч, што е точно ако state_key не е препокриен.
+
+        :param key: клуч на состојба
+        :return: состојба
+        """
+        return key
+
+    def map_actions(self, actions, from_state, to_state):
+        """Ако state_key ги спојува симетричните состојби, врати ги акциите
+        кои од состојбата to_state прават исто што и actions од симетричната
+        состојба from_state. Го користи bidirectional_breadth_first_search
+        кога двете страни се среќаваат во различни симетрични состојби.
+
+        :param actions: листа од акции кои се применуваат од from_state
+        :param from_state: дадена состојба
+        :param to_state: состојба симетрична на from_state
+        :return: листа од акции кои се применуваат од to_state
+        :rtype: list
+        """
+        raise NotImplementedError
+
+    def h(self, node):
+        """Хевристичка функција: проценка на цената од состојбата во
+        јазелот node до целта. Даденава имплементација враќа 0, што е
+        допустлива (admissible) хевристика за секој проблем.
+
+        :param node: даден јазел
+        :return: проценета цена до целта
+        :rtype: float
+        """
+        return 0
+
+
+class InstrumentedProblem(Problem):
+    """Обвивка околу даден проблем која брои колку пати пребарувањето
+    ги повикало неговите методи: succs е бројот на експандирани јазли,
+    goal_tests бројот на проверки за цел, а states бројот на генерирани
+    состојби."""
+
+    def __init__(self, problem):
+        self.problem = problem
+        self.succs = self.goal_tests = self.states = 0
+        self.found = None
+
+    def actions(self, state):
+        self.succs += 1
+        return self.problem.actions(state)
+
+    def result(self, state, action):
+        self.states += 1
+        return self.problem.result(state, action)
+
+    def transitions(self, state):
+        self.succs += 1
+        for transition in self.problem.transitions(state):
+            self.states += 1
+            yield transition
+
+    def reverse_transitions(self, state):
+        self.succs += 1
+        for transition in self.problem.reverse_transitions(state):
+            self.states += 1
+            yield transition
+
+    def goal_test(self, state):
+        self.goal_tests += 1
+        result = self.problem.goal_test(state)
+        if result:
+            self.found = state
+        return result
+
+    def path_cost(self, c, state1, action, state2):
+        return self.problem.path_cost(c, state1, action, state2)
+
+    def value(self):
+        return self.problem.value()
+
+    def h(self, node):
+        return self.problem.h(node)
+
+    def state_key(self, state):
+        return self.problem.state_key(state)
+
+    def instance_key(self):
+        return self.problem.instance_key()
+
+    def key_state(self, key):
+        return self.problem.key_state(key)
+
+    def map_actions(self, actions, from_state, to_state):
+        return self.problem.map_actions(actions, from_state, to_state)
+
+    def __getattr__(self, attr):
+        return getattr(self.problem, attr)
+
+    def __repr__(self):
+        return '<%d/%d/%d>' % (self.succs, self.goal_tests, self.states)
+
+
+class SearchStats:
+    """Статистики за едно пребарување. Објектот се предава на функциите
+    за пребарување како stats=SearchStats(), а по пребарувањето ги содржи:
+
+    - expanded, generated, goal_tests: број на експандирани јазли,
+      генерирани следбеници и проверки за цел
+    - duplicates: следбеници отфрлени бидејќи состојбата веќе е видена
+    - max_frontier, max_closed: најголема големина на редицата и на
+      затворената листа (множеството видени состојби)
+    - time_total, time_successors, time_goal_test, time_other: вкупно
+      време и време за генерирање следбеници, за проверки за цел и за сè
+      друго (операции над редицата и затворената листа, хевристика)
+    - layers: кај пребарувањата во ширина, за секој слој речник со
+      depth, expanded, generated, frontier, closed и time
+
+    Ако е дадена функцијата on_expand, таа се повикува со (stats, state)
+    на секои every експанзии, на пример за прикажување на напредокот.
+    Без stats пребарувањата не плаќаат речиси ништо за мерењето."""
+
+    def __init__(self, on_expand=None, every=1):
+        self.on_expand = on_expand
+        self.every = every
+        self.expanded = self.generated = self.goal_tests = self.duplicates = 0
+        self.max_frontier = self.max_closed = 0
+        self.time_total = self.time_successors = self.time_goal_test = 0.0
+        self.layers = []
+        self.running = False
+        self.layered = False
+        self.depth = None
+
+    @property
+    def time_other(self):
+        return self.time_total - self.time_successors - self.time_goal_test
+
+    def start(self, problem):
+        self.running = True
+        self.started = time.perf_counter()
+        return _StatsProblem(problem, self)
+
+    def stop(self):
+        self.close_layer()
+        self.time_total += time.perf_counter() - self.started
+        self.running = False
+
+    def observe(self, node, frontier, closed):
+        """Повикај пред експанзијата на јазелот node, со моменталната
+        големина на редицата и на затворената листа. Ако layered е True
+        (го поставуваат пребарувањата во ширина), при промена на
+        длабочината се започнува нов слој во layers."""
+        self.observe_depth(node.depth, frontier, closed)
+
+    def observe_depth(self, depth, frontier, closed):
+        """Исто како observe, за пребарувања кои немаат јазол, туку само
+        длабочина на состојбата која се експандира."""
+        if frontier > self.max_frontier:
+            self.max_frontier = frontier
+        if closed > self.max_closed:
+            self.max_closed = closed
+        if self.layered and depth != self.depth:
+            self.close_layer()
+            self.depth = depth
+            self.layer = {'depth': depth, 'expanded': self.expanded, 'generated': self.generated,
+                          'frontier': frontier, 'closed': closed, 'time': time.perf_counter()}
+
+    def close_layer(self):
+        if self.depth is None:
+            return
+        layer = self.layer
+        layer['expanded'] = self.expanded - layer['expanded']
+        layer['generated'] = self.generated - layer['generated']
+        layer['time'] = time.perf_counter() - layer['time']
+        self.layers.append(layer)
+        self.depth = None
+
+    def __repr__(self):
+        return ('<expanded: %d generated: %d duplicates: %d goal tests: %d max frontier: %d '
+                'max closed: %d time: %.4f s (successors %.4f, goal test %.4f, other %.4f)>'
+                % (self.expanded, self.generated, self.duplicates, self.goal_tests, self.max_frontier,
+                   self.max_closed, self.time_total, self.time_successors, self.time_goal_test,
+                   self.time_other))
+
+
+class _StatsProblem(InstrumentedProblem):
+    """Обвивка околу проблемот која ги полни бројачите и времињата на
+    SearchStats."""
+
+    def __init__(self, problem, stats):
+        super().__init__(problem)
+        self.stats = stats
+
+    def _successors(self, transitions, state):
+        stats = self.stats
+        start = time.perf_counter()
+        result = list(transitions(state))
+        stats.time_successors += time.perf_counter() - start
+        stats.expanded += 1
+        stats.generated += len(result)
+        if stats.on_expand is not None and stats.expanded % stats.every == 0:
+            stats.on_expand(stats, state)
+        return result
+
+    def transitions(self, state):
+        return self._successors(self.problem.transitions, state)
+
+    def reverse_transitions(self, state):
+        return self._successors(self.problem.reverse_transitions, state)
+
+    def goal_test(self, state):
+        stats = self.stats
+        start = time.perf_counter()
+        result = self.problem.goal_test(state)
+        stats.time_goal_test += time.perf_counter() - start
+        stats.goal_tests += 1
+        return result
+
+
+def instrumented(search):
+    """Декоратор за функциите за пребарување кој им додава аргумент stats.
+    Ако е даден SearchStats, проблемот се обвива така што се мерат
+    експанзиите и проверките за цел, а самото пребарување може со
+    stats.observe да ги запише и големините на редицата и затворената
+    листа. Вгнездените повици (на пример astar_search кон
+    best_first_graph_search) го делат истиот stats."""
+
+    @functools.wraps(search)
+    def wrapper(problem, *args, stats=None, **kwargs):
+        if stats is None or stats.running:
+            return search(problem, *args, stats=stats, **kwargs)
+        problem = stats.start(problem)
+        try:
+            return search(problem, *args, stats=stats, **kwargs)
+        finally:
+            stats.stop()
+
+    return wrapper
+
+
+"""
+Дефинирање на класата за структурата на јазел од пребарување.
+Класата Node не се наследува
+"""
+
+
+class Node:
+    # без __dict__ по јазел; кај пребарувањата во ширина се чуваат милиони јазли
+    __slots__ = ('state', 'parent', 'action', 'path_cost', 'depth')
+
+    def __init__(self, state, parent=None, action=None, path_cost=0):
+        """Креирај јазол од пребарувачкото дрво, добиен од parent со примена
+        на акцијата action
+
+        :param state: моментална состојба (current state)
+        :param parent: родителска состојба (parent state)
+        :param action: акција (action)
+        :param path_cost: цена на патот (path cost)
+        """
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost
+        self.depth = 0  # search depth
+        if parent:
+            self.depth = parent.depth + 1
+
+    def __repr__(self):
+        return "<Node %s>" % (self.state,)
+
+    def __lt__(self, node):
+        return self.state < node.state
+
+    def expand(self, problem):
+        """Излистај ги јазлите достапни во еден чекор од овој јазол.
+
+        :param problem: даден проблем
+        :return: листа на достапни јазли во еден чекор
+        :rtype: list(Node)
+        """
+        return [self.child_node(problem, action, next_state, cost)
+                for action, next_state, cost in problem.transitions(self.state)]
+
+    def child_node(self, problem, action, next_state=None, cost=None):
+        """Дете јазел. Ако следбеникот и цената на чекорот не се дадени,
+        се пресметуваат со problem.result и problem.path_cost.
+
+        :param problem: даден проблем
+        :param action: дадена акција
+        :param next_state: состојба добиена со акцијата (ако е веќе позната)
+        :param cost: цена на чекорот (ако е веќе позната)
+        :return: достапен јазел според дадената акција
+        :rtype: Node
+        """
+        if next_state is None:
+            next_state = problem.result(self.state, action)
+            return Node(next_state, self, action,
+                        problem.path_cost(self.path_cost, self.state,
+                                          action, next_state))
+        return Node(next_state, self, action, self.path_cost + cost)
+
+    def solution(self):
+        """Врати ја секвенцата од акции за да се стигне од коренот до овој јазол.
+
+        :return: секвенцата од акции
+        :rtype: list
+        """
+        return [node.action for node in self.path()[1:]]
+
+    def solve(self):
+        """Врати ја секвенцата од состојби за да се стигне од коренот до овој јазол.
+
+        :return: листа од состојби
+        :rtype: list
+        """
+        return [node.state for node in self.path()[0:]]
+
+    def path(self):
+        """Врати ја листата од јазли што го формираат патот од коренот до овој јазол.
+
+        :return: листа од јазли од патот
+        :rtype: list(Node)
+        """
+        x, result = self, []
+        while x:
+            result.append(x)
+            x = x.parent
+        result.reverse()
+        return result
+
+    """Сакаме редицата од јазли кај breadth_first_search или 
+    astar_search да не содржи состојби - дупликати, па јазлите што
+    содржат иста состојба ги третираме како исти. [Проблем: ова може
+    да не биде пожелно во други ситуации.]"""
+
+    def __eq__(self, other):
+        return isinstance(other, Node) and self.state == other.state
+
+    def __hash__(self):
+        return hash(self.state)
+
+
+def node_key(problem):
+    """Врати функција која за даден јазел го враќа клучот на неговата
+    состојба, problem.state_key(node.state). Според овој клуч се
+    препознаваат дупликатите во редиците и во затворената листа.
+
+    :param problem: даден проблем
+    :return: функција од јазел во клуч
+    """
+    state_key = problem.state_key
+    return lambda node: state_key(node.state)
+
+
+"""
+Дефинирање на помошни структури за чување на листата на генерирани, но непроверени јазли
+"""
+
+
+# ознака за избришан запис во PriorityQueue
+_REMOVED = object()
+
+
+class Queue:
+    """Queue е апстрактна класа / интерфејс. Постојат 3 типа:
+        Stack(): Last In First Out Queue (стек).
+        FIFOQueue(): First In First Out Queue (редица).
+        PriorityQueue(order, f): Queue во сортиран редослед (подразбирливо,од најмалиот кон
+                                 најголемиот јазол).
+    """
+
+    def __init__(self):
+        raise NotImplementedError
+
+    def append(self, item):
+        """Додади го елементот item во редицата
+
+        :param item: даден елемент
+        :return: None
+        """
+        raise NotImplementedError
+
+    def extend(self, items):
+        """Додади ги елементите items во редицата
+
+        :param items: дадени елементи
+        :return: None
+        """
+        raise NotImplementedError
+
+    def pop(self):
+        """Врати го првиот елемент од редицата
+
+        :return: прв елемент
+        """
+        raise NotImplementedError
+
+    def __len__(self):
+        """Врати го бројот на елементи во редицата
+
+        :return: број на елементи во редицата
+        :rtype: int
+        """
+        raise NotImplementedError
+
+    def __contains__(self, item):
+        """Проверка дали редицата го содржи елементот item
+
+        :param item: даден елемент
+        :return: дали queue го содржи item
+        :rtype: bool
+        """
+        raise NotImplementedError
+
+
+class Stack(Queue):
+    """Last-In-First-Out Queue."""
+
+    def __init__(self):
+        self.data = []
+
+    def append(self, item):
+        self.data.append(item)
+
+    def extend(self, items):
+        self.data.extend(items)
+
+    def pop(self):
+        return self.data.pop()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, item):
+        return item in self.data
+
+
+class FIFOQueue(Queue):
+    """First-In-First-Out Queue. Елементите се чуваат во deque, а покрај
+    нив и бројач на клучеви, така што append, pop и проверката за
+    припадност се со константна сложеност."""
+
+    def __init__(self, key=lambda x: x):
+        """
+        :param key: функција која за даден елемент враќа hashable клуч,
+                    на пример node_key(problem)
+        """
+        self.data = deque()
+        self.key = key
+        self.counts = {}
+
+    def append(self, item):
+        k = self.key(item)
+        self.data.append((k, item))
+        self.counts[k] = self.counts.get(k, 0) + 1
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def pop(self):
+        k, item = self.data.popleft()
+        count = self.counts[k]
+        if count == 1:
+            del self.counts[k]
+        else:
+            self.counts[k] = count - 1
+        return item
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, item):
+        return self.key(item) in self.counts
+
+
+class PriorityQueue(Queue):
+    """Редица во која прво се враќа минималниот (или максималниот) елемент
+    (како што е определено со f и order). Оваа структура се користи кај
+    информирано пребарување. Имплементирана е како бинарен heap, со индекс
+    од клучот на елементот до неговиот запис во heap-от, така што додавање,
+    вадење, намалување на приоритетот и бришење се со сложеност O(log n).
+    Елементите со иста f вредност се враќаат по редоследот на додавање."""
+
+    def __init__(self, order=min, f=lambda x: x, key=lambda x: x):
+        """
+        :param order: функција за подредување, ако order е min, се враќа елементот
+                      со минимална f(x); ако order е max, тогаш се враќа елементот
+                      со максимална f(x).
+        :param f: функција f(x)
+        :param key: функција која за даден елемент враќа hashable клуч;
+                    редицата чува најмногу еден елемент по клуч
+        """
+        assert order in [min, max]
+        self.heap = []
+        self.index = {}
+        self.counter = itertools.count()
+        self.order = order
+        self.f = f
+        self.key = key
+
+    def _priority(self, item):
+        value = self.f(item)
+        return value if self.order == min else -value
+
+    def append(self, item):
+        """Додади го елементот item во редицата. Ако во редицата веќе постои
+        елемент со ист клуч, се задржува оној со подобар приоритет
+        (decrease-key).
+
+        :param item: даден елемент
+        :return: None
+        """
+        k = self.key(item)
+        priority = self._priority(item)
+        entry = self.index.get(k)
+        if entry is not None:
+            if entry[0] <= priority:
+                return
+            entry[-1] = _REMOVED
+        entry = [priority, next(self.counter), k, item]
+        self.index[k] = entry
+        heapq.heappush(self.heap, entry)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def pop(self):
+        while self.heap:
+            priority, count, k, item = heapq.heappop(self.heap)
+            if item is not _REMOVED:
+                del self.index[k]
+                return item
+        raise IndexError('pop from empty priority queue')
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, item):
+        return self.key(item) in self.index
+
+    def __getitem__(self, key):
+        entry = self.index.get(self.key(key))
+        if entry is not None:
+            return entry[-1]
+
+    def __delitem__(self, key):
+        entry = self.index.pop(self.key(key), None)
+        if entry is not None:
+            entry[-1] = _REMOVED
+
+
+"""
+Неинформирано пребарување во рамки на дрво.
+Во рамки на дрвото не разрешуваме јамки.
+"""
+
+
+@instrumented
+def tree_search(problem, fringe, stats=None):
+    """ Пребарувај низ следбениците на даден проблем за да најдеш цел.
+
+    :param problem: даден проблем
+    :param fringe:  празна редица (queue)
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    fringe.append(Node(problem.initial))
+    while fringe:
+        node = fringe.pop()
+        if stats is not None:
+            stats.observe(node, len(fringe) + 1, 0)
+        # print(node.state)
+        if problem.goal_test(node.state):
+            return node
+        fringe.extend(node.expand(problem))
+    return None
+
+
+@instrumented
+def breadth_first_tree_search(problem, stats=None):
+    """Експандирај го прво најплиткиот јазол во пребарувачкото дрво.
+
+    :param problem: даден проблем
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    if stats is not None:
+        stats.layered = True
+    return tree_search(problem, FIFOQueue(node_key(problem)), stats=stats)
+
+
+@instrumented
+def depth_first_tree_search(problem, stats=None):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкото дрво.
+
+    :param problem:даден проблем
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    return tree_search(problem, Stack(), stats=stats)
+
+
+"""
+Неинформирано пребарување во рамки на граф
+Основната разлика е во тоа што овде не дозволуваме јамки, 
+т.е. повторување на состојби
+"""
+
+
+@instrumented
+def graph_search(problem, fringe, stats=None):
+    """Пребарувај низ следбениците на даден проблем за да најдеш цел.
+     Ако до дадена состојба стигнат два пата, употреби го најдобриот пат.
+
+    :param problem: даден проблем
+    :param fringe: празна редица (queue)
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    closed = set()
+    fringe.append(Node(problem.initial))
+    while fringe:
+        node = fringe.pop()
+        if stats is not None:
+            stats.observe(node, len(fringe) + 1, len(closed))
+        if problem.goal_test(node.state):
+            return node
+
+        state = problem.state_key(node.state)
+        if state not in closed:
+            closed.add(state)
+            fringe.extend(node.expand(problem))
+        elif stats is not None:
+            stats.duplicates += 1
+
+    return None
+
+
+@instrumented
+def breadth_first_graph_search(problem, stats=None):
+    """Експандирај го прво најплиткиот јазол во пребарувачкиот граф.
+    Целта се проверува уште при генерирањето на јазлите, а состојбите се
+    означуваат како посетени кога се додаваат во редицата, па последниот
+    слој не се генерира и ниту една состојба не е двапати во редицата.
+    Решението е исто како кај graph_search(problem, FIFOQueue(...)).
+
+    :param problem: даден проблем
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    node = Node(problem.initial)
+    if problem.goal_test(node.state):
+        return node
+    state_key = problem.state_key
+    seen = {state_key(node.state)}
+    fringe = deque([node])
+    if stats is not None:
+        stats.layered = True
+    while fringe:
+        node = fringe.popleft()
+        if stats is not None:
+            stats.observe(node, len(fringe) + 1, len(seen))
+        for child in node.expand(problem):
+            key = state_key(child.state)
+            if key not in seen:
+                if problem.goal_test(child.state):
+                    return child
+                seen.add(key)
+                fringe.append(child)
+            elif stats is not None:
+                stats.duplicates += 1
+    return None
+
+
+@instrumented
+def bidirectional_breadth_first_search(problem, stats=None):
+    """Пребарувај во ширина истовремено од почетната состојба нанапред и од
+    целната состојба problem.goal наназад (со problem.reverse_transitions),
+    секогаш проширувајќи го целиот слој на помалата страна. Двете страни
+    се среќаваат на ист клуч problem.state_key, а патот се спојува така што
+    на нанапредниот јазел му се додаваат акциите од наназадниот.
+
+    :param problem: даден проблем со целна состојба и обратни акции
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    state_key = problem.state_key
+    start = Node(problem.initial)
+    goal = Node(problem.goal)
+    if state_key(start.state) == state_key(goal.state):
+        return start
+
+    forward = {state_key(start.state): start}
+    backward = {state_key(goal.state): goal}
+    forward_layer = [start]
+    backward_layer = [goal]
+
+    while forward_layer and backward_layer:
+        forward_step = len(forward_layer) <= len(backward_layer)
+        if forward_step:
+            layer, visited, other = forward_layer, forward, backward
+            successors = problem.transitions
+        else:
+            layer, visited, other = backward_layer, backward, forward
+            successors = problem.reverse_transitions
+
+        # го прошируваме целиот слој, за да се најде најевтиното спојување
+        best = None
+        next_layer = []
+        for node in layer:
+            if stats is not None:
+                stats.observe(node, len(forward_layer) + len(backward_layer) + len(next_layer),
+                              len(forward) + len(backward))
+            for action, next_state, cost in successors(node.state):
+                key = state_key(next_state)
+                if key in visited:
+                    if stats is not None:
+                        stats.duplicates += 1
+                    continue
+                child = Node(next_state, node, action, node.path_cost + cost)
+                visited[key] = child
+                next_layer.append(child)
+                if key in other:
+                    total = child.path_cost + other[key].path_cost
+                    if best is None or total < best[0]:
+                        best = (total, child, other[key])
+
+        if best is not None:
+            total, child, meeting = best
+            if forward_step:
+                node, backward_node = child, meeting
+            else:
+                node, backward_node = meeting, child
+            if node.state != backward_node.state:
+                # клучот ги спојува симетричните состојби, па акциите од
+                # наназадната страна се пресликуваат во состојбата на
+                # нанапредната страна
+                actions = []
+                meeting = backward_node
+                while backward_node.parent is not None:
+                    actions.append(backward_node.action)
+                    backward_node = backward_node.parent
+                for action in problem.map_actions(actions, meeting.state, node.state):
+                    node = node.child_node(problem, action)
+                return node
+            while backward_node.parent is not None:
+                node = Node(backward_node.parent.state, node, backward_node.action,
+                            node.path_cost + backward_node.path_cost
+                            - backward_node.parent.path_cost)
+                backward_node = backward_node.parent
+            return node
+
+        if forward_step:
+            forward_layer = next_layer
+        else:
+            backward_layer = next_layer
+    return None
+
+
+def _write_keys(path, keys, key_bytes, chunk=1 << 16):
+    """Запиши ги клучевите keys во датотеката path, секој како key_bytes
+    бајти (big-endian), и врати колку клучеви се запишани."""
+    count = 0
+    with open(path, 'wb') as f:
+        buffer = []
+        for key in keys:
+            buffer.append(key.to_bytes(key_bytes, 'big'))
+            if len(buffer) == chunk:
+                f.write(b''.join(buffer))
+                count += len(buffer)
+                buffer = []
+        f.write(b''.join(buffer))
+        count += len(buffer)
+    return count
+
+
+def _read_keys(path, key_bytes, chunk=1 << 16):
+    """Генератор на клучевите запишани со _write_keys."""
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(key_bytes * chunk)
+            if not data:
+                return
+            for i in range(0, len(data), key_bytes):
+                yield int.from_bytes(data[i:i + key_bytes], 'big')
+
+
+def _contains_key(path, key, key_bytes):
+    """Бинарно пребарување на клучот key во сортираната датотека path."""
+    with open(path, 'rb') as f:
+        lo, hi = 0, os.path.getsize(path) // key_bytes
+        while lo < hi:
+            mid = (lo + hi) // 2
+            f.seek(mid * key_bytes)
+            value = int.from_bytes(f.read(key_bytes), 'big')
+            if value < key:
+                lo = mid + 1
+            elif value > key:
+                hi = mid
+            else:
+                return True
+    return False
+
+
+def _sorted_difference(keys, removed):
+    """Од сортираниот поток keys врати ги различните клучеви кои не се во
+    сортираниот поток removed."""
+    removed = iter(removed)
+    current = next(removed, None)
+    last = None
+    for key in keys:
+        if key == last:
+            continue
+        last = key
+        while current is not None and current < key:
+            current = next(removed, None)
+        if current != key:
+            yield key
+
+
+@instrumented
+def external_breadth_first_search(problem, buffer_size=10 ** 6, directory=None, key_bytes=None,
+                                  previous_layers=2, stats=None):
+    """Пребарување во ширина со надворешна меморија. Секој слој се чува на
+    диск како сортирана низа од клучеви со фиксна ширина, а во меморијата
+    се чуваат најмногу buffer_size нови клучеви: кога баферот ќе се
+    наполни, се сортира и се запишува како посебна датотека. Дупликатите
+    се отстрануваат одложено, кога слојот ќе заврши: датотеките на
+    слојот се спојуваат и од нив се исфрлаат клучевите од претходните
+    previous_layers слоеви. Два слоја се доволни ако секоја акција може да
+    се врати (како кај CrnoBelo), бидејќи тогаш следбеник на слојот d е
+    во слојот d - 1, d или d + 1.
+
+    Проблемот мора да има целоброен state_key, инверзен key_state и
+    reverse_transitions, со кои патот се реконструира наназад низ
+    слоевите на дискот.
+
+    :param problem: даден проблем
+    :param buffer_size: најголем број на клучеви во меморијата
+    :param directory: директориум за датотеките (подразбирливо привремен)
+    :param key_bytes: ширина на клучот во бајти (подразбирливо според
+                      поголемиот од клучевите на почетната и целната состојба)
+    :param previous_layers: колку претходни слоеви се проверуваат за дупликати
+    :param stats: SearchStats во кој се собираат статистики (опционално);
+                  max_frontier е најголемиот бафер, а max_closed бројот
+                  на состојби запишани на дискот
+    :return: Node
+    """
+    node = Node(problem.initial)
+    if problem.goal_test(node.state):
+        return node
+    state_key, key_state = problem.state_key, problem.key_state
+    if key_bytes is None:
+        largest = state_key(problem.initial)
+        if problem.goal is not None:
+            largest = max(largest, state_key(problem.goal))
+        key_bytes = max(1, (largest.bit_length() + 7) // 8)
+    if stats is not None:
+        stats.layered = True
+
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        layers = [os.path.join(tmp, 'layer0')]
+        closed = _write_keys(layers[0], [state_key(node.state)], key_bytes)
+        found = None
+        while found is None:
+            depth = len(layers) - 1
+            runs = []
+            buffer = set()
+            generated = 0
+            for key in _read_keys(layers[depth], key_bytes):
+                state = key_state(key)
+                if stats is not None:
+                    stats.observe_depth(depth, len(buffer), closed)
+                for action, next_state, cost in problem.transitions(state):
+                    if problem.goal_test(next_state):
+                        found = (state, action, next_state, cost)
+                        break
+                    buffer.add(state_key(next_state))
+                    generated += 1
+                    if len(buffer) >= buffer_size:
+                        runs.append(os.path.join(tmp, 'run%d' % len(runs)))
+                        _write_keys(runs[-1], sorted(buffer), key_bytes)
+                        buffer = set()
+                if found is not None:
+                    break
+            if found is not None:
+                break
+
+            # одложено отстранување на дупликатите: спојување на сортираните
+            # датотеки на новиот слој, без клучевите од претходните слоеви
+            # баферот за читање на секоја датотека е таков што вкупно се
+            # чуваат најмногу околу buffer_size клучеви
+            buffer = sorted(buffer)
+            chunk = max(256, (buffer_size - len(buffer)) // (len(runs) + previous_layers))
+            merged = heapq.merge(buffer, *[_read_keys(run, key_bytes, chunk) for run in runs])
+            previous = heapq.merge(*[_read_keys(layer, key_bytes, chunk) for layer in layers[-previous_layers:]])
+            layers.append(os.path.join(tmp, 'layer%d' % (depth + 1)))
+            count = _write_keys(layers[-1], _sorted_difference(merged, previous), key_bytes, chunk)
+            buffer = None
+            for run in runs:
+                os.remove(run)
+            closed += count
+            if stats is not None:
+                stats.duplicates += generated - count
+            if count == 0:
+                return None
+
+        # реконструкција на патот наназад: за секој слој, претходник на
+        # тековната состојба кој е во претходниот слој
+        state, action, next_state, cost = found
+        path = [(action, next_state, cost)]
+        for depth in range(len(layers) - 2, -1, -1):
+            for action, previous_state, cost in problem.reverse_transitions(state):
+                if _contains_key(layers[depth], state_key(previous_state), key_bytes):
+                    path.append((action, state, cost))
+                    state = previous_state
+                    break
+            else:
+                raise ValueError("претходникот не е пронајден; дали секоја акција може да се врати?")
+
+    node = Node(state)
+    for action, next_state, cost in reversed(path):
+        node = node.child_node(problem, action, next_state, cost)
+    return node
+
+
+def _pack_keys(keys, key_bytes):
+    """Спакувај ја листата од цели броеви keys во bytes со фиксна ширина."""
+    if key_bytes <= 8:
+        return array('Q', keys).tobytes()
+    return b''.join(key.to_bytes(key_bytes, 'big') for key in keys)
+
+
+def _unpack_keys(data, key_bytes):
+    """Инверз на _pack_keys."""
+    if key_bytes <= 8:
+        keys = array('Q')
+        keys.frombytes(data)
+        return keys
+    return [int.from_bytes(data[i:i + key_bytes], 'big') for i in range(0, len(data), key_bytes)]
+
+
+def _owner(key, processes):
+    """Процесот кој е сопственик на состојбата со клуч key."""
+    return (hash(key) * 0x9E3779B97F4A7C15 >> 40) % processes
+
+
+def _parallel_bfs_worker(problem, index, processes, control, inboxes, results, key_bytes, batch_size):
+    """Процес кој ги чува состојбите чиј сопственик е, со нивните родители,
+    и на наредба од главниот процес го проширува својот дел од слојот.
+    Ако нешто не успее, на results се праќа ('error', index, traceback)."""
+    try:
+        _parallel_bfs_loop(problem, index, processes, control, inboxes, results, key_bytes, batch_size)
+    except Exception:
+        results.put(('error', index, traceback.format_exc()))
+
+
+def _parallel_bfs_loop(problem, index, processes, control, inboxes, results, key_bytes, batch_size):
+    state_key, key_state = problem.state_key, problem.key_state
+    inbox = inboxes[index]
+    parents = {}
+    frontier = []
+    while True:
+        message = control.get()
+        if message[0] == 'root':
+            parents[message[1]] = None
+            frontier = [message[1]]
+        elif message[0] == 'expand':
+            # следбениците се праќаат кон нивните сопственици во пакети од
+            # парови (следбеник, родител)
+            expanded = len(frontier)
+            generated = 0
+            outgoing = [[] for _ in range(0, processes)]
+            for key in frontier:
+                for action, next_state, cost in problem.transitions(key_state(key)):
+                    child = state_key(next_state)
+                    owner = _owner(child, processes)
+                    batch = outgoing[owner]
+                    batch.append(child)
+                    batch.append(key)
+                    generated += 1
+                    if len(batch) >= 2 * batch_size:
+                        inboxes[owner].put(_pack_keys(batch, key_bytes))
+                        outgoing[owner] = []
+            for owner in range(0, processes):
+                if outgoing[owner]:
+                    inboxes[owner].put(_pack_keys(outgoing[owner], key_bytes))
+                inboxes[owner].put(None)
+
+            # бариера: слојот е примен кога ќе стигне крајот од секој процес
+            frontier = []
+            found = None
+            ends = 0
+            while ends < processes:
+                data = inbox.get()
+                if data is None:
+                    ends += 1
+                    continue
+                keys = _unpack_keys(data, key_bytes)
+                for i in range(0, len(keys), 2):
+                    child = keys[i]
+                    if child not in parents:
+                        parents[child] = keys[i + 1]
+                        frontier.append(child)
+                        if found is None and problem.goal_test(key_state(child)):
+                            found = child
+            results.put(('layer', index, len(frontier), found, expanded, generated, len(parents)))
+        elif message[0] == 'parent':
+            results.put(('parent', index, parents[message[1]]))
+        else:
+            return
+
+
+def _parallel_bfs_result(results, workers, timeout=1.0):
+    """Следната порака од процесите. Ако некој процес јавил грешка или
+    умрел без да јави, се фрла RuntimeError наместо да се чека засекогаш."""
+    while True:
+        try:
+            message = results.get(timeout=timeout)
+        except queue.Empty:
+            dead = [index for index, worker in enumerate(workers) if not worker.is_alive()]
+            if dead:
+                raise RuntimeError("процесот %d на parallel_breadth_first_search заврши неочекувано "
+                                   "(exit code %s)" % (dead[0], workers[dead[0]].exitcode))
+            continue
+        if message[0] == 'error':
+            raise RuntimeError("грешка во процесот %d на parallel_breadth_first_search:\n%s"
+                               % (message[1], message[2]))
+        return message
+
+
+@instrumented
+def parallel_breadth_first_search(problem, processes=None, batch_size=4096, key_bytes=None, stats=None):
+    """Пребарување во ширина распределено на processes процеси. Секоја
+    состојба има сопственик според хешот на нејзиниот клуч. Слоевите се
+    пребаруваат синхроно: секој процес го проширува својот дел од слојот,
+    следбениците ги праќа на нивните сопственици во пакети од спакувани
+    цели броеви, па чека крајот од сите процеси (бариера) пред да ги
+    отфрли веќе видените. Секој процес чува мапа од своите состојби до
+    нивните родители, од која патот се реконструира на крајот.
+
+    Проблемот мора да има целоброен state_key и инверзен key_state.
+    Функцијата не може да се повика од демонски процес (на пример од
+    процес на multiprocessing.Pool), бидејќи тој не може да има деца.
+
+    :param problem: даден проблем
+    :param processes: број на процеси (подразбирливо бројот на јадра)
+    :param batch_size: број на парови (следбеник, родител) во еден пакет
+    :param key_bytes: ширина на клучот во бајти (подразбирливо според
+                      поголемиот од клучевите на почетната и целната состојба)
+    :param stats: SearchStats во кој се собираат статистики (опционално);
+                  процесите ги јавуваат бројачите по слој, а max_closed е
+                  вкупниот број на видени состојби
+    :return: Node
+    """
+    node = Node(problem.initial)
+    if problem.goal_test(node.state):
+        return node
+    if multiprocessing.current_process().daemon:
+        raise ValueError("parallel_breadth_first_search не може да се повика од демонски процес")
+    processes = processes or os.cpu_count() or 1
+    state_key = problem.state_key
+    root = state_key(problem.initial)
+    # проблемот мора да може да ја врати состојбата од клучот; ова се
+    # проверува пред да се стартуваат процесите
+    problem.key_state(root)
+    largest = root
+    if problem.goal is not None:
+        largest = max(largest, state_key(problem.goal))
+    if key_bytes is None:
+        key_bytes = max(1, (largest.bit_length() + 7) // 8)
+    elif largest.bit_length() > 8 * key_bytes:
+        raise ValueError("клучот %d не собира во %d бајти" % (largest, key_bytes))
+
+    # процесите го добиваат проблемот без обвивката на stats; бројачите
+    # ги јавуваат самите
+    worker_problem = problem.problem if isinstance(problem, _StatsProblem) else problem
+    if stats is not None:
+        stats.layered = True
+    controls = [multiprocessing.Queue() for _ in range(0, processes)]
+    inboxes = [multiprocessing.Queue() for _ in range(0, processes)]
+    results = multiprocessing.Queue()
+    workers = [multiprocessing.Process(target=_parallel_bfs_worker,
+                                       args=(worker_problem, index, processes, controls[index], inboxes,
+                                             results, key_bytes, batch_size), daemon=True)
+               for index in range(0, processes)]
+    for worker in workers:
+        worker.start()
+    try:
+        controls[_owner(root, processes)].put(('root', root))
+        found = None
+        depth, frontier, closed = 0, 1, 1
+        while found is None:
+            if stats is not None:
+                stats.observe_depth(depth, frontier, closed)
+            for control in controls:
+                control.put(('expand',))
+            layer = [_parallel_bfs_result(results, workers) for _ in range(0, processes)]
+            frontier = sum(message[2] for message in layer)
+            closed = sum(message[6] for message in layer)
+            if stats is not None:
+                stats.expanded += sum(message[4] for message in layer)
+                stats.generated += sum(message[5] for message in layer)
+                stats.goal_tests += frontier
+                stats.duplicates += sum(message[5] for message in layer) - frontier
+            if frontier == 0:
+                return None
+            goals = [message[3] for message in layer if message[3] is not None]
+            if goals:
+                found = min(goals)
+            depth += 1
+
+        # реконструкција на патот преку мапите на родители
+        keys = [found]
+        while keys[-1] != root:
+            controls[_owner(keys[-1], processes)].put(('parent', keys[-1]))
+            keys.append(_parallel_bfs_result(results, workers)[2])
+    finally:
+        for control in controls:
+            control.put(('stop',))
+        for worker in workers:
+            worker.join(1)
+            if worker.is_alive():
+                worker.terminate()
+
+    # акциите се наоѓаат повторно меѓу следбениците на секој родител
+    for key in reversed(keys[:-1]):
+        for action, next_state, cost in worker_problem.transitions(node.state):
+            if state_key(next_state) == key:
+                node = node.child_node(problem, action, next_state, cost)
+                break
+    return node
+
+
+@instrumented
+def depth_first_graph_search(problem, stats=None):
+    """Експандирај го прво најдлабокиот јазол во пребарувачкиот граф.
+
+    :param problem: даден проблем
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    return graph_search(problem, Stack(), stats=stats)
+
+
+class _TranspositionTable:
+    """Ограничена табела од клуч на состојба до најмалата длабочина (или
+    цена) со која е достигната. Кога табелата е полна, се исфрла најстарата
+    состојба."""
+
+    def __init__(self, size):
+        self.size = size
+        self.data = OrderedDict()
+
+    def improves(self, key, depth):
+        """Запиши ја длабочината depth за клучот key и врати True, освен ако
+        клучот веќе е достигнат на иста или помала длабочина."""
+        old = self.data.get(key)
+        if old is not None:
+            if old <= depth:
+                return False
+        elif len(self.data) >= self.size:
+            self.data.popitem(last=False)
+        self.data[key] = depth
+        return True
+
+    def __contains__(self, key):
+        return key in self.data
+
+
+@instrumented
+def depth_limited_search(problem, limit=50, table_size=0, stats=None):
+    """Пребарување во длабочина до длабочина limit, со експлицитен стек
+    наместо рекурзија, па длабочината не е ограничена од Python. Ако
+    table_size > 0, се користи транспозициска табела со најмногу
+    table_size состојби: состојба до која веќе се стигнало на иста или
+    помала длабочина не се проширува повторно.
+
+    :param problem: даден проблем
+    :param limit: најголема длабочина
+    :param table_size: големина на транспозициската табела (0 за без табела)
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node, None ако нема решение или 'cutoff' ако пребарувањето
+             е прекинато на длабочина limit
+    """
+    node = Node(problem.initial)
+    if problem.goal_test(node.state):
+        return node
+    if limit == 0:
+        return 'cutoff'
+    state_key = problem.state_key
+    table = _TranspositionTable(table_size) if table_size else None
+    if table is not None:
+        table.improves(state_key(node.state), 0)
+    cutoff_occurred = False
+    # на стекот се итератори низ следбениците на јазлите на тековниот пат
+    stack = [iter(node.expand(problem))]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            continue
+        if table is not None and not table.improves(state_key(child.state), child.depth):
+            if stats is not None:
+                stats.duplicates += 1
+            continue
+        if stats is not None:
+            stats.observe(child, len(stack), len(table.data) if table is not None else 0)
+        if problem.goal_test(child.state):
+            return child
+        if child.depth == limit:
+            cutoff_occurred = True
+        else:
+            stack.append(iter(child.expand(problem)))
+    if cutoff_occurred:
+        return 'cutoff'
+    return None
+
+
+@instrumented
+def iterative_deepening_search(problem, table_size=0, stats=None):
+    """Повторувај depth_limited_search со длабочина 0, 1, 2, ... се додека
+    пребарувањето не заврши без прекин.
+
+    :param problem: даден проблем
+    :param table_size: големина на транспозициската табела (види
+                       depth_limited_search)
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    for depth in itertools.count():
+        result = depth_limited_search(problem, depth, table_size, stats=stats)
+        if result != 'cutoff':
+            return result
+
+
+@instrumented
+def ida_star_search(problem, h=None, table_size=0, stats=None):
+    """IDA* пребарување: пребарување во длабочина кое ги отфрла јазлите со
+    f(node) = g(node) + h(node) поголемо од границата, која по секоја
+    итерација се зголемува на најмалото отфрлено f. Со допустлива
+    хевристика решението е оптимално, а меморијата е пропорционална на
+    длабочината. Ако table_size > 0, се користи транспозициска табела со
+    најмногу table_size состојби: состојба до која во тековната итерација
+    веќе се стигнало со иста или помала цена не се проширува повторно.
+    Со табела пребарувањето завршува и кога целта е недостижна: ако
+    табелата не се наполнила и сите отфрлени следбеници се состојби кои
+    во итерацијата веќе се достигнати, целиот достижен простор е поминат.
+
+    :param problem: даден проблем
+    :param h: хевристичка функција (подразбирливо problem.h)
+    :param table_size: големина на транспозициската табела (0 за без табела)
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    h = h or problem.h
+    state_key = problem.state_key
+    root = Node(problem.initial)
+    if problem.goal_test(root.state):
+        return root
+    bound = h(root)
+    if bound == float('inf'):
+        # допустливата хевристика кажува дека целта е недостижна
+        return None
+    while True:
+        table = _TranspositionTable(table_size) if table_size else None
+        if table is not None:
+            table.improves(state_key(root.state), 0)
+        next_bound = float('inf')
+        # отфрлени следбеници кои уште не биле во табелата
+        pruned = set() if table is not None else None
+        stack = [iter(root.expand(problem))]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            f = child.path_cost + h(child)
+            if f > bound:
+                if f < next_bound:
+                    next_bound = f
+                if pruned is not None and f != float('inf'):
+                    key = state_key(child.state)
+                    if key not in table:
+                        pruned.add(key)
+                continue
+            if table is not None and not table.improves(state_key(child.state), child.path_cost):
+                if stats is not None:
+                    stats.duplicates += 1
+                continue
+            if stats is not None:
+                stats.observe(child, len(stack), len(table.data) if table is not None else 0)
+            if problem.goal_test(child.state):
+                return child
+            stack.append(iter(child.expand(problem)))
+        if next_bound == float('inf'):
+            return None
+        if pruned is not None and len(table.data) < table.size and all(key in table for key in pruned):
+            return None
+        bound = next_bound
+
+
+@instrumented
+def best_first_graph_search(problem, f, stats=None):
+    """Пребарувај низ следбениците на даден проблем, експандирајќи го прво
+    јазолот со најмала вредност f(node). Ако до дадена состојба во редицата
+    се стигне со подобар пат, неговиот запис се заменува (decrease-key).
+
+    :param problem: даден проблем
+    :param f: функција за евалуација на јазел
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    closed = set()
+    state_key = problem.state_key
+    fringe = PriorityQueue(min, f, node_key(problem))
+    fringe.append(Node(problem.initial))
+    while fringe:
+        node = fringe.pop()
+        if stats is not None:
+            stats.observe(node, len(fringe) + 1, len(closed))
+        if problem.goal_test(node.state):
+            return node
+        closed.add(state_key(node.state))
+        for child in node.expand(problem):
+            if state_key(child.state) not in closed:
+                fringe.append(child)
+            elif stats is not None:
+                stats.duplicates += 1
+    return None
+
+
+@instrumented
+def uniform_cost_search(problem, stats=None):
+    """Експандирај го прво јазолот со најниска цена во пребарувачкиот граф."""
+    return best_first_graph_search(problem, lambda node: node.path_cost, stats=stats)
+
+
+"""
+Информирано пребарување во рамки на граф
+"""
+
+
+@instrumented
+def greedy_best_first_graph_search(problem, h=None, stats=None):
+    """Greedy best-first пребарување: експандирај го прво јазолот со
+    најмала вредност на хевристиката h(node).
+
+    :param problem: даден проблем
+    :param h: хевристичка функција (подразбирливо problem.h)
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    h = h or problem.h
+    return best_first_graph_search(problem, h, stats=stats)
+
+
+@instrumented
+def astar_search(problem, h=None, stats=None):
+    """A* пребарување: експандирај го прво јазолот со најмала вредност
+    f(node) = g(node) + h(node). Ако h е допустлива, решението е оптимално.
+
+    :param problem: даден проблем
+    :param h: хевристичка функција (подразбирливо problem.h)
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    return weighted_astar_search(problem, h, 1, stats=stats)
+
+
+@instrumented
+def weighted_astar_search(problem, h=None, w=2, stats=None):
+    """Weighted A* пребарување со f(node) = g(node) + w * h(node). За w > 1
+    се експандираат помалку јазли, а цената на решението е најмногу w пати
+    поголема од оптималната.
+
+    :param problem: даден проблем
+    :param h: хевристичка функција (подразбирливо problem.h)
+    :param w: тежина на хевристиката
+    :param stats: SearchStats во кој се собираат статистики (опционално)
+    :return: Node
+    """
+    h = h or problem.h
+    return best_first_graph_search(problem, lambda node: node.path_cost + w * h(node), stats=stats)
+
+
+def compare_searchers(problem, searchers):
+    """Изврши го секое пребарување од searchers над problem и испечати го
+    бројот на експандирани јазли, проверки за цел и генерирани состојби,
+    како и должината на најденото решение.
+
+    :param problem: даден проблем
+    :param searchers: листа од функции за пребарување
+    :return: None
+    """
+    for searcher in searchers:
+        p = InstrumentedProblem(problem)
+        node = searcher(p)
+        length = len(node.solution()) if node is not None else None
+        print('%-32s expanded: %8d  goal tests: %8d  generated: %8d  solution: %s'
+              % (searcher.__name__, p.succs, p.goal_tests, p.states, length))
+
+
+def benchmark_fifo(sizes=(10 ** 5, 10 ** 6), ops=10 ** 4):
+    """Споредба на FIFOQueue со редица врз обична листа (pop(0)). Редицата
+    се полни до дадената големина, па се мери времето на ops парови
+    pop/append и ops проверки за припадност при таа големина.
+
+    :param sizes: големини на редицата
+    :param ops: број на операции кои се мерат
+    """
+    class ListFIFOQueue(FIFOQueue):
+        def __init__(self):
+            self.data = []
+
+        def append(self, item):
+            self.data.append(item)
+
+        def pop(self):
+            return self.data.pop(0)
+
+        def __contains__(self, item):
+            return item in self.data
+
+    for size in sizes:
+        for name, fifo in (('list', ListFIFOQueue()),
+                           ('deque', FIFOQueue(key=lambda item: item))):
+            for i in range(size):
+                fifo.append(i)
+            start = time.perf_counter()
+            for i in range(ops):
+                fifo.append(fifo.pop())
+            pop_time = time.perf_counter() - start
+            # членство се проверува само на 1% од операциите, бидејќи
+            # линеарното пребарување во листата е премногу бавно
+            checks = max(1, ops // 100)
+            start = time.perf_counter()
+            for i in range(checks):
+                (size - 1 - i) in fifo
+            contains_time = time.perf_counter() - start
+            print("%-6s n=%-8d pop+append: %8.3f us/op   contains: %10.3f us/op"
+                  % (name, size, pop_time / ops * 1e6, contains_time / checks * 1e6))
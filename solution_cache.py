@@ -0,0 +1,131 @@
+"""
+Кеш на решенија пред функциите за пребарување. Решенијата се чуваат
+според канонскиот клуч на примерокот (Problem.instance_key) и името на
+пребарувањето, во меморија со LRU исфрлање и, по избор, во sqlite база
+која останува меѓу извршувањата.
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+
+from searching_framework import breadth_first_graph_search
+
+
+class SolutionCache:
+    """LRU кеш на решенија со најмногу maxsize записи во меморија. Ако е
+    дадена патека path, решенијата се запишуваат и во sqlite база; таа
+    чува најмногу disk_maxsize записи (None значи без граница), а
+    исфрла ги најдолго некористените.
+
+    Бројачите hits и misses ги бројат погодоците и промашувањата, а
+    disk_hits колку од погодоците се пронајдени само во базата."""
+
+    def __init__(self, maxsize=1024, path=None, disk_maxsize=None):
+        self.maxsize = maxsize
+        self.disk_maxsize = disk_maxsize
+        self.data = OrderedDict()
+        self.hits = self.misses = self.disk_hits = 0
+        self.db = None
+        self.tick = 0
+        self.touched = {}
+        if path is not None:
+            self.db = sqlite3.connect(path, timeout=30)
+            self.db.execute('CREATE TABLE IF NOT EXISTS solutions '
+                            '(key TEXT PRIMARY KEY, solution TEXT, used INTEGER)')
+            self.db.execute('CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)')
+            self.tick = self.db.execute('SELECT COALESCE(MAX(used), 0) FROM solutions').fetchone()[0]
+            self.db.commit()
+
+    def get(self, key):
+        """Врати (True, решение) ако клучот е во кешот, инаку (False, None).
+        Решението None значи дека примерокот нема решение."""
+        if key in self.data:
+            self.data.move_to_end(key)
+            self.hits += 1
+            if self.db is not None:
+                # и погодоците во меморијата се користење на записот во
+                # базата, инаку тој би изгледал стар и би се исфрлил прв
+                self.tick += 1
+                self.touched[key] = self.tick
+            return True, self.data[key]
+        if self.db is not None:
+            row = self.db.execute('SELECT solution FROM solutions WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                # времето на користење се запишува во базата дури при
+                # следното запишување, за читањето да не ја заклучува базата
+                self.tick += 1
+                self.touched[key] = self.tick
+                solution = json.loads(row[0])
+                self._remember(key, solution)
+                self.hits += 1
+                self.disk_hits += 1
+                return True, solution
+        self.misses += 1
+        return False, None
+
+    def put(self, key, solution):
+        """Зачувај го решението solution (листа од акции или None) за клучот key."""
+        self._remember(key, solution)
+        if self.db is not None:
+            self.tick += 1
+            self.db.execute('INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)',
+                            (key, json.dumps(solution), self.tick))
+            self._flush()
+            if self.disk_maxsize is not None:
+                self.db.execute('DELETE FROM solutions WHERE key IN (SELECT key FROM solutions '
+                                'ORDER BY used DESC LIMIT -1 OFFSET ?)', (self.disk_maxsize,))
+            self.db.commit()
+
+    def _flush(self):
+        self.db.executemany('UPDATE solutions SET used = ? WHERE key = ?',
+                            [(tick, key) for key, tick in self.touched.items()])
+        self.touched.clear()
+
+    def _remember(self, key, solution):
+        self.data[key] = solution
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def key(self, problem, searcher=breadth_first_graph_search):
+        """Врати го клучот во кешот за problem решен со searcher, или None
+        ако проблемот не се кешира. Различни пребарувања може да најдат
+        различни решенија, па името на пребарувањето е дел од клучот."""
+        key = problem.instance_key()
+        if key is None:
+            return None
+        return '%s:%s' % (searcher.__name__, key)
+
+    def solve(self, problem, searcher=breadth_first_graph_search):
+        """Врати го решението на problem со searcher, од кешот ако веќе е
+        пресметано. Проблемите чиј instance_key е None не се кешираат.
+
+        :param problem: даден проблем
+        :param searcher: функција за пребарување
+        :return: листа од акции или None ако нема решение
+        """
+        key = self.key(problem, searcher)
+        if key is not None:
+            found, solution = self.get(key)
+            if found:
+                return solution
+        node = searcher(problem)
+        solution = node.solution() if node is not None else None
+        if key is not None:
+            self.put(key, solution)
+        return solution
+
+    def close(self):
+        if self.db is not None:
+            self._flush()
+            self.db.commit()
+            self.db.close()
+            self.db = None
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return '<SolutionCache %d/%d hits: %d misses: %d disk hits: %d>' % (
+            len(self.data), self.maxsize, self.hits, self.misses, self.disk_hits)
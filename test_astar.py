@@ -0,0 +1,20 @@
+"""Тестови за astar_search и uniform_cost_search."""
+
+import unittest
+
+from searching_framework import astar_search, uniform_cost_search
+from search_tests import EngineTestCase, crnobelo_problems, podvizhni_problems
+
+
+class AstarTest(EngineTestCase):
+
+    def test_crnobelo(self):
+        self.assertSameAsBFS(crnobelo_problems, astar_search)
+
+    def test_podvizhni(self):
+        self.assertSameAsBFS(podvizhni_problems, astar_search)
+        self.assertSameAsBFS(podvizhni_problems, uniform_cost_search)
+
+
+if __name__ == '__main__':
+    unittest.main()
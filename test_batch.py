@@ -0,0 +1,66 @@
+"""Тестови за batch.solve_batch и batch.read_instances."""
+
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from searching_framework import breadth_first_graph_search
+from batch import read_instances, solve_batch
+from CrnoBelo import random_board
+from PodvizhniPrepreki import PodvizniPrepreki
+
+
+class BatchTest(unittest.TestCase):
+
+    def instances(self):
+        rng = random.Random(7)
+        return [
+            {'id': 'a', 'problem': 'CrnoBelo', 'n': 3, 'polinja': random_board(3, 4, rng)},
+            {'id': 'b', 'problem': 'CrnoBelo', 'n': 3, 'polinja': random_board(3, 4, rng), 'engine': 'bfs'},
+            {'id': 'c', 'problem': 'CrnoBelo', 'n': 4, 'polinja': [0] + [1] * 15, 'engine': 'chase'},
+            {'id': 'd', 'problem': 'PodvizniPrepreki', 'choveche': [0, 0], 'kukja': [10, 10], 'engine': 'astar'},
+            {'id': 'e', 'problem': 'PodvizniPrepreki', 'choveche': [0, 0], 'kukja': [10, 10], 'engine': 'nema'},
+            {'id': 'f', 'problem': 'CrnoBelo', 'n': 39, 'polinja': random_board(39, 100, rng)},
+        ]
+
+    def test_solve_batch(self):
+        results = {result['id']: result for result in solve_batch(self.instances(), processes=1)}
+        self.assertEqual(sorted(results), ['a', 'b', 'c', 'd', 'e', 'f'])
+        for name in ('a', 'b', 'd'):
+            self.assertEqual(results[name]['status'], 'ok')
+            self.assertEqual(results[name]['length'], len(results[name]['solution']))
+        self.assertEqual(results['c']['status'], 'unsolvable')
+        self.assertEqual(results['e']['status'], 'error')
+        self.assertIn('KeyError', results['e']['error'])
+        # нултиот простор за n=39 е преголем за минимално решение
+        self.assertEqual(results['f']['status'], 'suboptimal')
+        self.assertIsNotNone(results['f']['solution'])
+        expected = breadth_first_graph_search(PodvizniPrepreki((0, 0), (10, 10)))
+        self.assertEqual(results['d']['length'], len(expected.solution()))
+        self.assertGreater(results['d']['expanded'], 0)
+
+    def test_ordered(self):
+        ids = [result['id'] for result in solve_batch(self.instances(), processes=1, ordered=True)]
+        self.assertEqual(ids, ['a', 'b', 'c', 'd', 'e', 'f'])
+
+    def test_cache(self):
+        instances = self.instances()[:4]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.db')
+            first = list(solve_batch(instances, processes=1, cache_path=path, cache_size=16))
+            second = list(solve_batch(instances, processes=1, cache_path=path, cache_size=16))
+        self.assertEqual([result['cached'] for result in first], [False] * 4)
+        self.assertEqual([result['cached'] for result in second], [True] * 4)
+        self.assertEqual([result['solution'] for result in first], [result['solution'] for result in second])
+
+    def test_read_instances(self):
+        lines = io.StringIO('\n'.join(json.dumps(instance) for instance in [{'problem': 'CrnoBelo'}, {'id': 7}])
+                            + '\n\n')
+        self.assertEqual([instance['id'] for instance in read_instances(lines)], [0, 7])
+
+
+if __name__ == '__main__':
+    unittest.main()
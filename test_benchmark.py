@@ -0,0 +1,46 @@
+"""Тестови за benchmark.py."""
+
+import contextlib
+import io
+import unittest
+
+import benchmark
+from searching_framework import benchmark_fifo
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_workloads_are_reproducible(self):
+        self.assertEqual(benchmark.crnobelo_boards(4, 3, 0), benchmark.crnobelo_boards(4, 3, 0))
+        self.assertNotEqual(benchmark.crnobelo_boards(4, 3, 0), benchmark.crnobelo_boards(4, 3, 1))
+        self.assertEqual(benchmark.podvizni_pairs(10, 0), benchmark.podvizni_pairs(10, 0))
+        self.assertEqual(len(benchmark.podvizni_pairs(10, 0)), 10)
+
+    def test_percentile(self):
+        self.assertEqual(benchmark.percentile([3, 1, 2, 4], 50), 2)
+        self.assertEqual(benchmark.percentile(range(1, 101), 95), 95)
+
+    def test_run_and_compare(self):
+        old = benchmark.run(repeat=1, boards=2, pairs=3, sizes=[3], out=None)
+        self.assertIn('CrnoBelo/n=3/gf2', old['results'])
+        self.assertIn('PodvizniPrepreki/table', old['results'])
+        for result in old['results'].values():
+            self.assertEqual(result['solved'], result['instances'])
+        self.assertEqual(benchmark.compare(old, old, out=io.StringIO()), [])
+
+        new = {'meta': old['meta'], 'results': dict(old['results'])}
+        slower = dict(new['results']['CrnoBelo/n=3/bfs'])
+        slower['total_median'] = 2 * slower['total_median'] + 1
+        slower['expanded'] += 1
+        new['results']['CrnoBelo/n=3/bfs'] = slower
+        self.assertEqual(benchmark.compare(old, new, out=io.StringIO()), ['CrnoBelo/n=3/bfs'])
+
+    def test_benchmark_fifo(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            benchmark_fifo(sizes=(100,), ops=100)
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+"""Тестови за bidirectional_breadth_first_search."""
+
+import unittest
+
+from searching_framework import SearchStats, bidirectional_breadth_first_search
+from CrnoBelo import CrnoBelo
+from search_tests import EngineTestCase, crnobelo_problems
+
+
+class BidirectionalTest(EngineTestCase):
+
+    def test_same_as_bfs(self):
+        self.assertSameAsBFS(crnobelo_problems, bidirectional_breadth_first_search)
+
+    def test_goal_is_initial(self):
+        stats = SearchStats()
+        node = bidirectional_breadth_first_search(CrnoBelo(3, [1] * 9, bitboard=True), stats=stats)
+        self.assertEqual(node.solution(), [])
+        self.assertEqual(stats.expanded, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,22 @@
+"""Тестови за chase_lights_search (CrnoBelo)."""
+
+import random
+import unittest
+
+from CrnoBelo import CrnoBelo, chase_lights_search, chase_lights_solve, random_board
+from search_tests import EngineTestCase, crnobelo_problems
+
+
+class ChaseTest(EngineTestCase):
+
+    def test_same_as_bfs(self):
+        self.assertSameAsBFS(crnobelo_problems, chase_lights_search)
+
+    def test_solved_board(self):
+        self.assertEqual(chase_lights_solve(5, CrnoBelo(5, [1] * 25, bitboard=True).initial), [])
+        problem = CrnoBelo(7, random_board(7, 10, random.Random(5)), bitboard=True)
+        self.assertIsNotNone(chase_lights_search(problem))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Тестови за depth_limited_search, iterative_deepening_search и ida_star_search."""
+
+import functools
+import unittest
+
+from searching_framework import depth_limited_search, iterative_deepening_search, ida_star_search
+from CrnoBelo import CrnoBelo
+from search_tests import EngineTestCase, crnobelo_problems, podvizhni_pairs, podvizhni_problems
+
+
+class DepthLimitedTest(EngineTestCase):
+
+    def test_ida(self):
+        self.assertSameAsBFS(crnobelo_problems, ida_star_search, solvable_only=True)
+        self.assertSameAsBFS(crnobelo_problems, functools.partial(ida_star_search, table_size=1 << 12),
+                             solvable_only=True)
+
+    def test_ida_podvizhni(self):
+        short = functools.partial(podvizhni_problems, podvizhni_pairs(10, seed=1))
+        self.assertSameAsBFS(short, functools.partial(ida_star_search, table_size=1 << 16), solvable_only=True)
+
+    def test_ida_unreachable(self):
+        # за n=4 има нерешливи табли; со табела IDA* завршува со None
+        self.assertSameAsBFS(crnobelo_problems, functools.partial(ida_star_search, table_size=1 << 13))
+        # бесконечна хевристика во коренот значи недостижна цел
+        problem = CrnoBelo(3, [1, 0, 0, 1, 1, 1, 0, 1, 0], bitboard=True)
+        self.assertIsNone(ida_star_search(problem, h=lambda node: float('inf')))
+
+    def test_ids(self):
+        self.assertSameAsBFS(crnobelo_problems, functools.partial(iterative_deepening_search, table_size=1 << 16),
+                             solvable_only=True)
+
+    def test_cutoff(self):
+        # решението на таблата е долго 3, па со помала граница има прекин
+        problem = CrnoBelo(3, [1, 0, 0, 1, 1, 1, 0, 1, 0], bitboard=True)
+        self.assertEqual(depth_limited_search(problem, 2), 'cutoff')
+        self.assertEqual(len(depth_limited_search(problem, 3).solution()), 3)
+        # стекот е експлицитен, па големата граница не ја надминува
+        # границата на рекурзија на Python
+        self.assertIsNotNone(depth_limited_search(problem, 5000, table_size=1 << 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
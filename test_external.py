@@ -0,0 +1,35 @@
+"""Тестови за external_breadth_first_search."""
+
+import functools
+import os
+import tempfile
+import unittest
+
+from searching_framework import external_breadth_first_search, SearchStats
+from CrnoBelo import CrnoBelo
+from search_tests import EngineTestCase, crnobelo_problems
+
+
+class ExternalTest(EngineTestCase):
+
+    def test_same_as_bfs(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertSameAsBFS(crnobelo_problems, functools.partial(external_breadth_first_search,
+                                                                      buffer_size=64, directory=directory))
+            # слоевите на дискот се бришат по пребарувањето
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_unsolvable_layers(self):
+        # нерешлива табла 4 x 4: се минува целиот дел од просторот до кој
+        # може да се стигне, во слоеви
+        problem = CrnoBelo(4, [0] + [1] * 15, bitboard=True)
+        stats = SearchStats()
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertIsNone(external_breadth_first_search(problem, buffer_size=256, directory=directory,
+                                                            stats=stats))
+        self.assertEqual(stats.expanded, 1 << 12)
+        self.assertTrue(stats.layers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Тестови за gf2_solve и gf2_search (CrnoBelo)."""
+
+import contextlib
+import io
+import random
+import sys
+import unittest
+from unittest import mock
+
+import CrnoBelo as crnobelo
+from CrnoBelo import CrnoBelo, gf2_search, gf2_solve, chase_lights_search, random_board, NotMinimalError
+from search_tests import EngineTestCase, crnobelo_problems
+
+
+class Gf2Test(EngineTestCase):
+
+    def test_same_as_bfs(self):
+        self.assertSameAsBFS(crnobelo_problems, gf2_search)
+
+    def test_large(self):
+        # решението мора да е исто долго како најкраткото од бркањето на
+        # светлата; n=62 има нулти простор со димензија 24
+        board = random_board(12, 40, random.Random(2))
+        problem = CrnoBelo(12, board, bitboard=True)
+        self.assertEqual(len(gf2_search(problem).solution()), len(chase_lights_search(problem).solution()))
+        if crnobelo.np is not None:
+            presses = gf2_solve(62, CrnoBelo(62, random_board(62, 100, random.Random(3)), bitboard=True).initial)
+            self.assertIsNotNone(presses)
+
+    def test_not_minimal(self):
+        problem = CrnoBelo(39, random_board(39, 200, random.Random(4)), bitboard=True)
+        with self.assertRaises(NotMinimalError) as context:
+            gf2_search(problem)
+        state = problem.initial
+        for action in context.exception.node.solution():
+            state = problem.result(state, action)
+        self.assertTrue(problem.goal_test(state))
+
+    def test_solved_board(self):
+        # решена табла не бара притисоци и кога нултиот простор е преголем
+        for n in (39, 47, 61):
+            self.assertEqual(gf2_solve(n, CrnoBelo(n, [1] * (n * n), bitboard=True).initial), [])
+
+    def test_main_not_minimal(self):
+        board = random_board(39, 200, random.Random(4))
+        stdin = io.StringIO('39\n%s\n' % ','.join(map(str, board)))
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch.object(sys, 'argv', ['CrnoBelo.py', 'gf2']), mock.patch.object(sys, 'stdin', stdin), \
+                contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            crnobelo.main()
+        self.assertTrue(stdout.getvalue().startswith('['))
+        self.assertIn('предупредување', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
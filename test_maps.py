@@ -0,0 +1,70 @@
+"""Тестови за мапите и распоредот на пречките кај PodvizniPrepreki."""
+
+import unittest
+
+import PodvizhniPrepreki as podvizhni
+from searching_framework import breadth_first_graph_search, astar_search
+from PodvizhniPrepreki import PodvizniPrepreki, RasporedPoPrepreki, TabelaPateki, ucitaj_mapa
+
+# 12 x 12 mapa so tri prepreki so periodi 4, 6 i 8
+MAPA = {'mapa': ['.' * 12] * 12,
+        'prepreki': [{'prepreka': [r, 1, r, 1], 'prostor': [r, 0, r, dolzhina], 'delta': [0, 1]}
+                     for r, dolzhina in ((2, 3), (5, 4), (8, 5))]}
+
+
+class MapsTest(unittest.TestCase):
+
+    def test_custom_map(self):
+        for choveche, kukja in (((0, 0), (11, 11)), ((11, 0), (0, 11)), ((3, 1), (9, 1))):
+            problem = PodvizniPrepreki(choveche, kukja, MAPA)
+            self.assertEqual(len(astar_search(problem).solution()),
+                             len(breadth_first_graph_search(problem).solution()))
+
+    def test_invalid_map(self):
+        with self.assertRaises(ValueError):
+            ucitaj_mapa({'mapa': ['...', '..'], 'prepreki': []})
+        izleguva = {'mapa': ['.' * 5] * 5,
+                    'prepreki': [{'prepreka': [1, 0, 1, 0], 'prostor': [1, 0, 1, 4], 'delta': [0, 1]}]}
+        with self.assertRaises(ValueError):
+            PodvizniPrepreki((0, 0), (4, 4), izleguva)
+
+    def test_lazy_schedule(self):
+        # so MAX_FAZI = 1 sekoja mapa go koristi RasporedPoPrepreki, koj
+        # mora da dade isti fazi kako listata od bitmapi
+        for mapa in (None, MAPA):
+            eager = PodvizniPrepreki(mapa=mapa)
+            max_fazi = podvizhni.MAX_FAZI
+            PodvizniPrepreki.mapi.clear()
+            podvizhni.MAX_FAZI = 1
+            try:
+                lazy = PodvizniPrepreki(mapa=mapa)
+            finally:
+                podvizhni.MAX_FAZI = max_fazi
+                PodvizniPrepreki.mapi.clear()
+            self.assertIsInstance(lazy.blokirani, RasporedPoPrepreki)
+            self.assertEqual(len(lazy.blokirani), len(eager.blokirani))
+            for faza in range(0, len(eager.blokirani)):
+                self.assertEqual(lazy.blokirani[faza], eager.blokirani[faza])
+                self.assertEqual(lazy.sledna_faza[faza], eager.sledna_faza[faza])
+            with self.assertRaises(ValueError):
+                TabelaPateki(lazy)
+
+
+    def test_lazy_schedule_cache(self):
+        # keshot na poslednite fazi ne smee da ja smeni bitmapata i koga
+        # fazite se baraat povtorno, ne po red i po isfrlanje od keshot
+        eager = PodvizniPrepreki(mapa=MAPA)
+        lazy = RasporedPoPrepreki(eager.staticki, [(mu, [eager.bitmapa(prepreka) for prepreka in niza])
+                                                   for mu, niza in eager.ciklusi(MAPA['prepreki'])])
+        kesh_fazi = podvizhni.KESH_FAZI
+        podvizhni.KESH_FAZI = 4
+        try:
+            for faza in list(range(len(eager.blokirani) - 1, -1, -1)) + [0, 5, 0, 17, 5, 23, 0] * 3:
+                self.assertEqual(lazy[faza], eager.blokirani[faza])
+                self.assertLessEqual(len(lazy.kesh), 4)
+        finally:
+            podvizhni.KESH_FAZI = kesh_fazi
+
+
+if __name__ == '__main__':
+    unittest.main()
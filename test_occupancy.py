@@ -0,0 +1,52 @@
+"""Тестови за битмапите на зафатени полиња и transitions кај PodvizniPrepreki."""
+
+import functools
+import unittest
+
+from searching_framework import Node, breadth_first_graph_search, astar_search, ida_star_search
+from PodvizhniPrepreki import PodvizniPrepreki, Prepreka, MAPA_OSNOVNA, tabela_search
+from search_tests import EngineTestCase, podvizhni_problems
+
+
+class OccupancyTest(EngineTestCase):
+
+    def test_bitmaps_follow_obstacles(self):
+        # bitmapata na sekoja faza e ista so polinjata pod preprekite
+        # koga tie se pomestuvaat so Prepreka.move
+        problem = PodvizniPrepreki()
+        prepreki = [Prepreka(*(p['prepreka'] + p['prostor'] + p['delta'])) for p in MAPA_OSNOVNA['prepreki']]
+        faza = 0
+        for _ in range(0, 2 * len(problem.blokirani)):
+            for redica in range(0, problem.redici):
+                for kolona in range(0, problem.koloni):
+                    pod = any(prepreka.hitChoveche((redica, kolona)) for prepreka in prepreki)
+                    blokirano = problem.blokirani[faza] >> (redica * problem.koloni + kolona) & 1
+                    self.assertEqual(bool(blokirano), pod or problem.ispadaChoveche((redica, kolona)))
+            prepreki = [prepreka.move() for prepreka in prepreki]
+            faza = problem.sledna_faza[faza]
+
+    def test_outside_grid(self):
+        # pochetok nadvor od mrezhata ne smee da gi pozajmi sosedite na
+        # drugo pole; rezultatite se kako vo originalnata implementacija
+        self.assertEqual(breadth_first_graph_search(PodvizniPrepreki((-1, 0), (0, 0))).solution(), ['Dolu'])
+        self.assertIsNone(breadth_first_graph_search(PodvizniPrepreki((0, 11), (0, 0))))
+        pairs = [(choveche, kukja) for choveche in ((-1, 0), (0, 11), (11, 3), (5, -1), (-1, -1))
+                 for kukja in ((0, 0), (10, 10), (5, 5), (-1, 0))]
+        self.assertSameAsBFS(functools.partial(podvizhni_problems, pairs), tabela_search)
+        self.assertSameAsBFS(functools.partial(podvizhni_problems, pairs), astar_search)
+
+    def test_start_on_wall(self):
+        # pochetok na pole '#' do slobodno pole: hevristikata mora da e
+        # konechna i dopustliva, inaku IDA* ne go naogja najkratkiot pat
+        pairs = [(choveche, kukja) for choveche in ((4, 8), (0, 6), (4, 10), (0, 10))
+                 for kukja in ((0, 0), (10, 10), (5, 8))]
+        self.assertSameAsBFS(functools.partial(podvizhni_problems, pairs), astar_search)
+        self.assertSameAsBFS(functools.partial(podvizhni_problems, pairs), tabela_search)
+        problem = PodvizniPrepreki((4, 8), (0, 0))
+        self.assertEqual(problem.h(Node(problem.initial)), 14)
+        self.assertEqual(len(ida_star_search(problem).solution()), 14)
+        self.assertEqual(len(ida_star_search(problem, table_size=1 << 16).solution()), 14)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+"""Тестови за parallel_breadth_first_search."""
+
+import functools
+import random
+import unittest
+
+from searching_framework import breadth_first_graph_search, parallel_breadth_first_search, SearchStats
+from CrnoBelo import CrnoBelo, random_board
+from search_tests import EngineTestCase, crnobelo_problems
+
+
+class BrokenCrnoBelo(CrnoBelo):
+    """CrnoBelo чии следбеници не може да се пресметаат надвор од почетната состојба."""
+
+    def transitions(self, state):
+        if state != self.initial:
+            raise KeyError(state)
+        return super().transitions(state)
+
+
+class ParallelTest(EngineTestCase):
+
+    def test_same_as_bfs(self):
+        for processes in (1, 2):
+            self.assertSameAsBFS(crnobelo_problems, functools.partial(parallel_breadth_first_search,
+                                                                      processes=processes, batch_size=16))
+
+    def test_stats(self):
+        problem = CrnoBelo(3, random_board(3, 4, random.Random(1)), bitboard=True)
+        stats = SearchStats()
+        node = parallel_breadth_first_search(problem, 2, stats=stats)
+        self.assertEqual(len(node.solution()), len(breadth_first_graph_search(problem).solution()))
+        self.assertEqual(len(stats.layers), node.depth)
+        self.assertGreater(stats.expanded, 0)
+
+    def test_worker_error(self):
+        # грешката во процес мора да стигне до повикувачот наместо
+        # процесите да чекаат засекогаш
+        problem = BrokenCrnoBelo(3, random_board(3, 4, random.Random(1)), bitboard=True)
+        with self.assertRaisesRegex(RuntimeError, 'KeyError'):
+            parallel_breadth_first_search(problem, 2)
+
+    def test_no_key_state(self):
+        # key_state не постои за канонските клучеви; ова се проверува пред
+        # да се стартуваат процесите
+        problem = CrnoBelo(3, random_board(3, 4, random.Random(1)), bitboard=True, symmetric=True)
+        with self.assertRaises(ValueError):
+            parallel_breadth_first_search(problem, 2)
+
+    def test_key_bytes(self):
+        problem = CrnoBelo(3, random_board(3, 4, random.Random(1)), bitboard=True)
+        with self.assertRaises(ValueError):
+            parallel_breadth_first_search(problem, 2, key_bytes=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
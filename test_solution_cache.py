@@ -0,0 +1,84 @@
+"""Тестови за SolutionCache."""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from searching_framework import breadth_first_graph_search
+from CrnoBelo import CrnoBelo
+from solution_cache import SolutionCache
+
+
+class SolutionCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.db')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def disk_keys(self):
+        with sqlite3.connect(self.path) as db:
+            return sorted(row[0] for row in db.execute('SELECT key FROM solutions'))
+
+    def test_hits_and_misses(self):
+        cache = SolutionCache(4)
+        self.assertEqual(cache.get('A'), (False, None))
+        cache.put('A', ['x'])
+        cache.put('B', None)
+        self.assertEqual(cache.get('A'), (True, ['x']))
+        self.assertEqual(cache.get('B'), (True, None))
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_memory_eviction(self):
+        cache = SolutionCache(2)
+        cache.put('A', [])
+        cache.put('B', [])
+        cache.get('A')
+        cache.put('C', [])
+        self.assertEqual(sorted(cache.data), ['A', 'C'])
+
+    def test_disk(self):
+        cache = SolutionCache(1, self.path)
+        cache.put('A', ['x'])
+        cache.put('B', ['y'])
+        cache.close()
+        cache = SolutionCache(1, self.path)
+        self.assertEqual(cache.get('A'), (True, ['x']))
+        self.assertEqual(cache.disk_hits, 1)
+        cache.close()
+
+    def test_disk_eviction(self):
+        cache = SolutionCache(1, self.path, disk_maxsize=2)
+        cache.put('A', [])
+        cache.put('B', [])
+        cache.get('A')
+        cache.put('C', [])
+        cache.close()
+        self.assertEqual(self.disk_keys(), ['A', 'C'])
+
+    def test_disk_eviction_memory_hits(self):
+        # погодоците во меморијата го освежуваат и записот во базата
+        cache = SolutionCache(4, self.path, disk_maxsize=2)
+        cache.put('A', [])
+        cache.put('B', [])
+        for _ in range(0, 5):
+            cache.get('A')
+        cache.put('C', [])
+        cache.close()
+        self.assertEqual(self.disk_keys(), ['A', 'C'])
+
+    def test_solve(self):
+        problem = CrnoBelo(3, [1, 0, 0, 1, 1, 1, 0, 1, 0], bitboard=True)
+        cache = SolutionCache(4)
+        first = cache.solve(problem)
+        self.assertEqual(first, breadth_first_graph_search(problem).solution())
+        self.assertEqual(cache.solve(problem), first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertIsNotNone(cache.key(problem))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Тестови за намалувањето со симетрии на CrnoBelo (symmetric=True)."""
+
+import functools
+import random
+import unittest
+
+from searching_framework import breadth_first_graph_search, bidirectional_breadth_first_search, astar_search
+from CrnoBelo import CrnoBelo
+from search_tests import EngineTestCase, crnobelo_problems
+
+
+class SymmetryTest(EngineTestCase):
+
+    def test_same_as_bfs(self):
+        symmetric = functools.partial(crnobelo_problems, symmetric=True)
+        self.assertSameAsBFS(symmetric, breadth_first_graph_search)
+        self.assertSameAsBFS(symmetric, bidirectional_breadth_first_search)
+        self.assertSameAsBFS(symmetric, astar_search)
+
+    def test_canonical(self):
+        # сите 8 слики на таблата имаат иста канонска форма, која е
+        # најмалата од нив
+        rng = random.Random(6)
+        for n in (2, 3, 4, 5):
+            problem = CrnoBelo(n, [1] * (n * n), bitboard=True, symmetric=True)
+            for _ in range(0, 20):
+                bits = rng.getrandbits(n * n)
+                images = [sum(1 << permutation[k] for k in range(0, n * n) if bits >> k & 1)
+                          for permutation in problem.permutations]
+                self.assertEqual({problem.canonical(image) for image in images}, {min(images)})
+
+
+if __name__ == '__main__':
+    unittest.main()
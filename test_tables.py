@@ -0,0 +1,33 @@
+"""Тестови за TabelaPateki и tabela_search (PodvizniPrepreki)."""
+
+import os
+import tempfile
+import unittest
+
+from PodvizhniPrepreki import PodvizniPrepreki, TabelaPateki, tabela_search
+from search_tests import EngineTestCase, podvizhni_pairs, podvizhni_problems
+
+
+class TablesTest(EngineTestCase):
+
+    def test_same_as_bfs(self):
+        self.assertSameAsBFS(podvizhni_problems, tabela_search)
+
+    def test_save_load(self):
+        problem = PodvizniPrepreki()
+        tabela = TabelaPateki(problem)
+        for choveche, kukja in podvizhni_pairs(10):
+            tabela.izgradi(kukja)
+        with tempfile.TemporaryDirectory() as direktorium:
+            pateka = os.path.join(direktorium, 'tabeli.pickle')
+            tabela.zachuvaj(pateka)
+            vcitana = TabelaPateki(problem)
+            vcitana.vcitaj(pateka)
+        self.assertEqual(vcitana.memorija(), tabela.memorija())
+        for choveche, kukja in podvizhni_pairs(10):
+            self.assertEqual(vcitana.pateka(choveche, kukja), tabela.pateka(choveche, kukja))
+            self.assertEqual(vcitana.rastojanie(choveche, kukja), len(tabela.pateka(choveche, kukja)))
+
+
+if __name__ == '__main__':
+    unittest.main()